@@ -19,14 +19,26 @@ from qtics import log
 from qtics.instruments import Instrument
 
 
+class Clock:
+    """Time source of the experiments, can be replaced to avoid real waits."""
+
+    sleep = staticmethod(time.sleep)
+
+
 class BaseExperiment(ABC):
     """Base experiment class."""
 
     def __init__(
-        self, name: str, data_file: Optional[str] = None, data_dir: Optional[str] = None
+        self,
+        name: str,
+        data_file: Optional[str] = None,
+        data_dir: Optional[str] = None,
+        clock: Optional[Clock] = None,
     ):
         """Initialize datafile and instruments names."""
         self.name = name
+        self.clock = clock if clock is not None else Clock()
+        self._h5: Optional[h5py.File] = None
         self.data_dir = data_dir
 
         if data_file is not None:
@@ -60,6 +72,7 @@ class BaseExperiment(ABC):
         """Disconnect all devices and delete."""
         self.all_instruments("clear_defaults")
         self.all_instruments("disconnect")
+        self.close_data_file()
 
     @abstractmethod
     def main(self):
@@ -78,6 +91,8 @@ class BaseExperiment(ABC):
             log.error("Exception occurred: %s", exc)
             self.all_instruments("reset")
             raise exc
+        finally:
+            self.close_data_file()
         log.info("Experiment run successfully.")
 
     def add_instrument(self, inst: Instrument):
@@ -106,19 +121,45 @@ class BaseExperiment(ABC):
         datasets: Optional[dict] = None,
         **attributes,
     ):
-        """Save data appending to hdf5 file."""
-        with h5py.File(self.data_file, "a") as file:
-            if parent_name is not None:
-                parent_group = file.require_group(parent_name)
-                group = parent_group.require_group(group_name)
-            else:
-                group = file.require_group(group_name)
-
-            if datasets is not None:
-                for data_name, data in datasets.items():
+        """Save data appending to hdf5 file.
+
+        The file is kept open between calls, until :meth:`close_data_file`.
+        Numeric arrays are stored chunked and compressed.
+        """
+        file = self._data_handle()
+        if parent_name is not None:
+            parent_group = file.require_group(parent_name)
+            group = parent_group.require_group(group_name)
+        else:
+            group = file.require_group(group_name)
+
+        if datasets is not None:
+            for data_name, data in datasets.items():
+                array = np.asarray(data)
+                if array.size > 1 and array.dtype.kind in "biufc":
+                    group.create_dataset(
+                        data_name,
+                        data=array,
+                        chunks=True,
+                        compression="lzf",
+                        shuffle=True,
+                    )
+                else:
                     group.create_dataset(data_name, data=data)
-            if attributes:
-                group.attrs.update(attributes)
+        if attributes:
+            group.attrs.update(attributes)
+
+    def _data_handle(self) -> h5py.File:
+        """Return the data file handle, opening the file if needed."""
+        if self._h5 is None:
+            self._h5 = h5py.File(self.data_file, "a")
+        return self._h5
+
+    def close_data_file(self):
+        """Flush and close the data file, if open."""
+        if self._h5 is not None:
+            self._h5.close()
+            self._h5 = None
 
     def get_datasets_dict(self, data_file: Optional[str] = None):
         """Load the datasets of an hdf5 file as dictionary."""
@@ -135,7 +176,9 @@ class BaseExperiment(ABC):
                         data[key] = _recurse(h5file, path + key + "/")
             return data
 
-        if not data_file:
+        if not data_file or data_file == self.data_file:
+            if self._h5 is not None:
+                return _recurse(self._h5, "/")
             data_file = self.data_file
 
         with h5py.File(data_file, "r") as h5file:
@@ -165,9 +208,12 @@ class MonitorExperiment(BaseExperiment):
         """Run the experiment continuously until event is set."""
         self.all_instruments("connect")
         log.info("Running monitor %s", self.name)
-        while not event.is_set():
-            time.sleep(self.sleep)
-            self.main()
+        try:
+            while not event.is_set():
+                self.clock.sleep(self.sleep)
+                self.main()
+        finally:
+            self.close_data_file()
         log.info("Trigger event set, %s shutting down.", self.name)
 
 
@@ -175,10 +221,14 @@ class Experiment(BaseExperiment):
     """Experiment with monitoring functions."""
 
     def __init__(
-        self, name: str, data_file: Optional[str] = None, data_dir: Optional[str] = None
+        self,
+        name: str,
+        data_file: Optional[str] = None,
+        data_dir: Optional[str] = None,
+        clock: Optional[Clock] = None,
     ):
         """Initialize."""
-        super().__init__(name, data_file=data_file, data_dir=data_dir)
+        super().__init__(name, data_file=data_file, data_dir=data_dir, clock=clock)
         self.monitors: List[MonitorExperiment] = []
         self.event = Event()
 
@@ -192,27 +242,38 @@ class Experiment(BaseExperiment):
         if len(self.monitors) == 0:
             super().run()
             return
-        with ThreadPoolExecutor(1 + len(self.monitors)) as executor:
-            futures = []
-            log.info("Starting experiment %s and monitors.", self.name)
-            for monitor in self.monitors:
-                futures.append(executor.submit(monitor.watch, self.event))
-            futures.append(executor.submit(self.main))
-            done, _ = wait(futures, return_when=FIRST_COMPLETED)
-            if len(done) > 0 and len(done) != len(futures):
-                future = done.pop()
-                if future.exception() is not None:
-                    log.warning(
-                        "One task failed with: %s, shutting down.",
-                        future.exception(),
-                    )
-                else:
-                    log.info(
-                        "Main experiment finished successfully, shutting down monitors."
-                    )
-                self.event.set()
-                for future in futures:
-                    future.cancel()
+        try:
+            with ThreadPoolExecutor(1 + len(self.monitors)) as executor:
+                try:
+                    self._run_parallel(executor)
+                finally:
+                    # Stop the monitors also on interruption, so the workers can exit
+                    self.event.set()
+        finally:
+            self.close_data_file()
+
+    def _run_parallel(self, executor: ThreadPoolExecutor):
+        """Submit main and monitors, wait until the first of them finishes."""
+        futures = []
+        log.info("Starting experiment %s and monitors.", self.name)
+        for monitor in self.monitors:
+            futures.append(executor.submit(monitor.watch, self.event))
+        futures.append(executor.submit(self.main))
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        if len(done) > 0 and len(done) != len(futures):
+            future = done.pop()
+            if future.exception() is not None:
+                log.warning(
+                    "One task failed with: %s, shutting down.",
+                    future.exception(),
+                )
+            else:
+                log.info(
+                    "Main experiment finished successfully, shutting down monitors."
+                )
+            self.event.set()
+            for future in futures:
+                future.cancel()
 
     def monitor_failed(self) -> bool:
         """Check if monitoring condition has failed and restore safe values."""
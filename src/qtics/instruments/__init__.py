@@ -1,5 +1,6 @@
 """Instruments submodule: collection of drivers."""
 
-from .instrument import Instrument
+from .async_io import ParallelDispatcher
+from .instrument import Instrument, cached_scpi
 from .network_inst import NetworkInst
 from .serial_inst import SerialInst
@@ -0,0 +1,104 @@
+"""Serial port driven by a dedicated process, decoupled from the main interpreter."""
+
+import multiprocessing as mp
+import queue
+import time
+from typing import Optional
+
+import serial
+
+POLL_TIMEOUT = 0.01  # Port read timeout in the reader process
+
+
+def _reader_proc(port: str, settings: dict, cmd_q, data_q, status_q, stop):
+    """Own the serial port, send queued commands and forward every received chunk."""
+    try:
+        ser = serial.serial_for_url(port, **settings)
+    except (serial.SerialException, ValueError) as exc:
+        status_q.put(exc)
+        return
+    status_q.put(None)
+    with ser:
+        while not stop.is_set():
+            try:
+                while True:
+                    ser.write(cmd_q.get_nowait())
+            except queue.Empty:
+                pass
+            chunk = ser.read(ser.in_waiting or 1)
+            if chunk:
+                data_q.put(chunk)
+
+
+class SerialReader:
+    """Serial port handled by a child process feeding a queue."""
+
+    def __init__(self, port: str, settings: dict):
+        """Initialize."""
+        self.port = port
+        self.settings = dict(settings, timeout=POLL_TIMEOUT)
+        self._cmd_q: "mp.Queue[bytes]" = mp.Queue()
+        self._data_q: "mp.Queue[bytes]" = mp.Queue()
+        self._status_q: "mp.Queue[Optional[Exception]]" = mp.Queue()
+        self._stop = mp.Event()
+        self._proc: Optional[mp.Process] = None
+        self._pending = bytearray()
+
+    def start(self, timeout: Optional[float] = 10):
+        """Spawn the reader process and wait for the port to be opened."""
+        self._proc = mp.Process(
+            target=_reader_proc,
+            args=(
+                self.port,
+                self.settings,
+                self._cmd_q,
+                self._data_q,
+                self._status_q,
+                self._stop,
+            ),
+            daemon=True,
+        )
+        self._proc.start()
+        try:
+            status = self._status_q.get(timeout=timeout)
+        except queue.Empty as exc:
+            self.stop()
+            raise TimeoutError(f"Serial port {self.port} not opened.") from exc
+        if status is not None:
+            self.stop()
+            raise status
+
+    def stop(self):
+        """Stop the reader process, closing the port."""
+        if self._proc is not None:
+            self._stop.set()
+            self._proc.join(timeout=1)
+            if self._proc.is_alive():
+                self._proc.terminate()
+            self._proc = None
+        self._pending.clear()
+
+    def write(self, data: bytes):
+        """Queue data to be written on the port."""
+        self._cmd_q.put(data)
+
+    def read_until(self, term: bytes, timeout: Optional[float]) -> bytes:
+        """Return the next frame ending with the terminator.
+
+        Data received after the terminator are kept for the following read.
+        If the timeout expires, the data received so far are returned.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while term not in self._pending:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                self._pending.extend(self._data_q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        idx = self._pending.find(term)
+        end = len(self._pending) if idx < 0 else idx + len(term)
+        frame = bytes(self._pending[:end])
+        del self._pending[:end]
+        return frame
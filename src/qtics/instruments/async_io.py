@@ -0,0 +1,53 @@
+"""Parallel dispatch of commands to independent instruments."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from qtics.instruments.instrument import Instrument
+
+
+class ParallelDispatcher:
+    """Run methods of different instruments in parallel threads.
+
+    Each instrument gets its own worker, so that calls to the same
+    instrument are executed in submission order while independent
+    instruments overlap their I/O latencies.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self._executors: Dict[int, ThreadPoolExecutor] = {}
+        self._futures: List[Future] = []
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc):
+        """Wait for pending calls and stop the workers."""
+        self.shutdown()
+
+    def submit(self, inst: Instrument, func_name: str, *args, **kwargs) -> Future:
+        """Schedule the call of an instrument method."""
+        executor = self._executors.get(id(inst))
+        if executor is None:
+            executor = ThreadPoolExecutor(1, thread_name_prefix=inst.name)
+            self._executors[id(inst)] = executor
+        future = executor.submit(inst.call_locked, func_name, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def wait(self) -> List[Any]:
+        """Wait for all the scheduled calls and return their results in order.
+
+        The first exception raised by a call is propagated.
+        """
+        futures, self._futures = self._futures, []
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Wait for pending calls and stop all the workers."""
+        for executor in self._executors.values():
+            executor.shutdown()
+        self._executors = {}
+        self._futures = []
@@ -1,19 +1,73 @@
 """Base Instrument."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from contextlib import contextmanager
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
 from qtics import log
 
+if TYPE_CHECKING:
+    # Type checkers understand the setter decorator of the builtin property only
+    cached_scpi = property
+else:
+
+    class cached_scpi(property):
+        """Property caching the last value read from or written to the instrument.
+
+        The getter queries the instrument only when no value is cached. After a
+        set, the value returned by the setter (or the assigned one, if the setter
+        returns None) is cached, and setting again the cached value does not write
+        to the instrument. Use :meth:`Instrument.invalidate` to force a new query.
+        """
+
+        def __set_name__(self, owner, name):
+            """Store the name of the property, used as cache key."""
+            self._name = name
+
+        def __get__(self, obj, objtype=None):
+            """Return the cached value, query the instrument if missing."""
+            if obj is None:
+                return self
+            try:
+                return obj._cache[self._name]
+            except KeyError:
+                value = super().__get__(obj, objtype)
+                obj._cache[self._name] = value
+                return value
+
+        def __set__(self, obj, value):
+            """Write the value to the instrument and cache it."""
+            if self.fset is None:
+                raise AttributeError(f"Property {self._name} has no setter.")
+            if self._name in obj._cache and obj._cache[self._name] == value:
+                return
+            written = self.fset(obj, value)
+            obj._cache[self._name] = value if written is None else written
+
 
 class Instrument(ABC):
     """Base instrument class."""
 
+    __slots__ = (
+        "name",
+        "address",
+        "_defaults",
+        "_cache",
+        "_lock",
+        "_batch",
+        "__weakref__",
+    )
+
     def __init__(self, name: str, address: str):
         """Initialize."""
         self.name = name
         self.address = address
         self._defaults: Dict[str, Any] = {}
+        self._cache: Dict[str, Any] = {}
+        self._lock = RLock()
+        self._batch: Optional[List[Union[str, bytes]]] = None
 
     @abstractmethod
     def connect(self):
@@ -35,6 +89,37 @@ class Instrument(ABC):
     def query(self, cmd) -> str:
         """Send a command and read from the instrument."""
 
+    def write_many(self, cmds: Sequence[Union[str, bytes]]):
+        """Send multiple commands to the instrument."""
+        for cmd in cmds:
+            self.write(cmd)
+
+    @contextmanager
+    def batch(self):
+        """Queue the written commands and send them together when exiting.
+
+        Reading from the instrument inside the block sends the queued commands
+        first, so queries are sent in the same message as the preceding writes.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = []
+        try:
+            yield self
+            self.flush()
+        finally:
+            self._batch = None
+
+    def flush(self):
+        """Send the commands queued by :meth:`batch`."""
+        if self._batch:
+            cmds, self._batch = self._batch, None
+            try:
+                self.write_many(cmds)
+            finally:
+                self._batch = []
+
     def get_id(self):
         """Return name of the device from SCPI standard query."""
         return self.query("*IDN?")
@@ -42,6 +127,7 @@ class Instrument(ABC):
     def reset(self, defaults=True):
         """Reset device with SCPI standard command."""
         self.write("*RST")
+        self.invalidate()
         if defaults:
             self.set_defaults()
 
@@ -63,6 +149,61 @@ class Instrument(ABC):
                 raise RuntimeError(f"The instrument does not have the {key} parameter.")
         return values
 
+    def invalidate(self, *names):
+        """Clear the cached values of the given properties, or all of them."""
+        if not names:
+            self._cache.clear()
+        for name in names:
+            self._cache.pop(name, None)
+
+    def refresh(self, *names) -> dict:
+        """Query again the given cached properties, or all of them."""
+        if not names:
+            names = tuple(
+                key
+                for key in dir(type(self))
+                if isinstance(getattr(type(self), key), cached_scpi)
+            )
+        self.invalidate(*names)
+        return self.get(*names)
+
+    def call_locked(self, func_name: str, *args, **kwargs):
+        """Call a method holding the instrument lock."""
+        with self._lock:
+            return getattr(self, func_name)(*args, **kwargs)
+
+    async def acall(self, func_name: str, *args, **kwargs):
+        """Call a method in a worker thread, without blocking the event loop."""
+        return await asyncio.to_thread(self.call_locked, func_name, *args, **kwargs)
+
+    async def aconnect(self):
+        """Connect to the instrument asynchronously."""
+        await self.acall("connect")
+
+    async def adisconnect(self):
+        """Disconnect from the instrument asynchronously."""
+        await self.acall("disconnect")
+
+    async def awrite(self, cmd, sleep=False):
+        """Send a command to the instrument asynchronously."""
+        await self.acall("write", cmd, sleep)
+
+    async def aread(self):
+        """Read from the instrument asynchronously."""
+        return await self.acall("read")
+
+    async def aquery(self, cmd):
+        """Send a command and read from the instrument asynchronously."""
+        return await self.acall("query", cmd)
+
+    async def aset(self, **kwargs):
+        """Set multiple attributes and/or properties asynchronously."""
+        await self.acall("set", **kwargs)
+
+    async def aget(self, *args) -> dict:
+        """Get multiple attributes and/or properties asynchronously."""
+        return await self.acall("get", *args)
+
     @staticmethod
     def validate_opt(opt: Union[str, int], allowed: tuple):
         """Check if provided option is between allowed ones."""
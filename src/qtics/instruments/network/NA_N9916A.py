@@ -179,35 +179,7 @@ class N9916A(NetworkInst, ABC):
             raise ValueError("Invalid data type selected.")
 
         self.write(cmd)
-
-        # Read # character, raise exception if not present.
-        if self.socket is None:
-            raise RuntimeError("Socket not initialized.")
-
-        if self.socket.recv(1) != b"#":
-            raise ValueError("Data in buffer is not in binblock format.")
-
-        # Extract header length and number of bytes in binblock.
-        header_length = int(self.socket.recv(1).decode("utf-8"), 16)
-        n_bytes = int(self.socket.recv(header_length).decode("utf-8"))
-
-        # Create a buffer and expose a memoryview for efficient socket reading
-        raw_data = bytearray(n_bytes)
-        buf = memoryview(raw_data)
-
-        while n_bytes:
-            # Read data from instrument into buffer.
-            bytes_recv = self.socket.recv_into(buf, n_bytes)
-            # Slice buffer to preserve data already written to it.
-            buf = buf[bytes_recv:]
-            # Subtract bytes received from total bytes.
-            n_bytes -= bytes_recv
-
-        # Receive termination character.
-        term = self.socket.recv(1)
-        if term != b"\n":
-            raise ValueError("Data not terminated correctly.")
-
+        raw_data = self.read_ieee_block()
         return np.frombuffer(raw_data, dtype=map_types[datatype]).astype(float)
 
     @abstractmethod
@@ -311,8 +283,7 @@ class VNAN9916A(N9916A):
     @smoothing.setter
     def smoothing(self, aperture: int):
         if aperture > 0:
-            self.write("CALC:SMO 1")
-            self.write(f"CALC:SMO:APER {abs(aperture)}")
+            self.write_many(["CALC:SMO 1", f"CALC:SMO:APER {abs(aperture)}"])
         else:
             self.write("CALC:SMO 0")
 
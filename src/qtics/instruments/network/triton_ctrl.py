@@ -6,11 +6,17 @@ moduleauthor: Rodolfo Carobene <rodolfo.carobene@mib.infn.it>
 """
 
 import time
+from functools import cached_property
+from typing import List, Tuple
 
 from qtics.instruments import NetworkInst
 
 ENABLE_SETTERS = False
 
+# Scale of the heater range units to mA
+RANGE_UNITS = {"nA": 1e-6, "uA": 1e-3, "mA": 1.0, "A": 1e3}
+HEATER_RANGES = (31.6 / 1e3, 100 / 1e3, 316 / 1e3, 1, 3.16, 10, 31.6, 100)
+
 
 class Triton(NetworkInst):
     """Controller of Triton dilution refrigerator by Oxford Instruments."""
@@ -28,12 +34,25 @@ class Triton(NetworkInst):
         super().__init__(name, address, port, timeout, sleep, no_delay)
         self._mixing_chamber_ch = 8
 
-    def query(self, cmd: str) -> str:
-        """Send a message, then read from the serial port."""
+    def query(self, cmd: str, pre_read_sleep: float = 0) -> str:
+        """Send a message, then read from the instrument."""
         self.write(cmd)
-        time.sleep(self.sleep)
+        if pre_read_sleep:
+            time.sleep(pre_read_sleep)
         return self.read()[len(cmd) + 1 :]
 
+    def query_batch(self, cmds: List[str], pre_read_sleep: float = 0) -> List[str]:
+        """Send multiple messages at once, then read all the responses in order."""
+        self.write("\n".join(cmds))
+        if pre_read_sleep:
+            time.sleep(pre_read_sleep)
+        return [self.read()[len(cmd) + 1 :] for cmd in cmds]
+
+    def get_action(self) -> Tuple[str, str]:
+        """Return status and current action of the dilution refrigerator."""
+        status, action = self.query_batch(["READ:SYS:DR:STATUS", "READ:SYS:DR:ACTN"])
+        return status, action
+
     @property
     def mixing_chamber_ch(self) -> int:
         """Return mixing chamber channel.
@@ -50,35 +69,50 @@ class Triton(NetworkInst):
     @mixing_chamber_ch.setter
     def mixing_chamber_ch(self, channel: int):
         self._mixing_chamber_ch = channel
+        for cmd in ("_cmd_mc_temp", "_cmd_mc_tset", "_cmd_mc_range"):
+            self.__dict__.pop(cmd, None)
+
+    @cached_property
+    def _cmd_mc_temp(self) -> str:
+        return f"READ:DEV:T{self.mixing_chamber_ch}:TEMP:SIG:TEMP"
+
+    @cached_property
+    def _cmd_mc_tset(self) -> str:
+        return f"READ:DEV:T{self.mixing_chamber_ch}:TEMP:LOOP:TSET"
+
+    @cached_property
+    def _cmd_mc_range(self) -> str:
+        return f"READ:DEV:T{self.mixing_chamber_ch}:TEMP:LOOP:RANGE"
 
     @property
     def heater_range(self) -> float:
         """Return heater range."""
-        answer = self.query(f"READ:DEV:T{self.mixing_chamber_ch}:TEMP:LOOP:RANGE")
+        answer = self.query(self._cmd_mc_range)
         if answer == "NOT_FOUND":
             raise RuntimeError("Range not set.")
-        conversions = {"uA": 1e-3, "mA": 1}
-        return float(answer[:-2]) * conversions[answer[-2:]]
+        value = answer.rstrip("Aunm")
+        return float(value) * RANGE_UNITS[answer[len(value) :]]
 
     @heater_range.setter
     def heater_range(self, hrange: float):
         if not ENABLE_SETTERS:
             raise RuntimeError("Setter not enabled!")
-        ranges = (31.6 / 1e3, 100 / 1e3, 316 / 1e3, 1, 3.16, 10, 31.6, 100)
-        if hrange not in ranges:
-            raise ValueError(f"Range {hrange} not allowed. Choose between {ranges}.")
+        if hrange not in HEATER_RANGES:
+            raise ValueError(
+                f"Range {hrange} not allowed. Choose between {HEATER_RANGES}."
+            )
 
         self.write(f"SET:DEV:T{self.mixing_chamber_ch}:TEMP:LOOP:RANGE:{hrange/1000}")
 
     def get_mixing_chamber_temp(self):
         """Return mixing chamber temperature in mK."""
-        answer = self.query(f"READ:DEV:T{self.mixing_chamber_ch}:TEMP:SIG:TEMP")
+        answer = self.query(self._cmd_mc_temp)
         return float(answer[:-1]) * 1000
 
     @property
     def mixing_chamber_tset(self) -> float:
         """Return mixing chamber set temperature in mK."""
-        answer = self.query(f"READ:DEV:T{self.mixing_chamber_ch}:TEMP:LOOP:TSET")
+        answer = self.query(self._cmd_mc_tset)
         if answer == "NOT_FOUND":
             raise RuntimeError("Temperature mixing not set.")
         return float(answer[:-1]) * 1000
@@ -8,12 +8,18 @@ The code was partially taken from https://github.com/morgan-at-keysight/socketsc
 """
 
 import ipaddress
+import logging
 import socket
 import time
+from typing import List, Optional, Sequence, Union
 
 from qtics import log
 from qtics.instruments import Instrument
 
+TERM = b"\n"
+SOCKET_BUF_SIZE = 1 << 20  # Large enough for multi-MB trace transfers
+RECV_SIZE = 1 << 16  # Size of the buffer receiving the responses
+
 
 class NetworkInst(Instrument):
     """Base class for instruments communicating via network connection."""
@@ -30,14 +36,20 @@ class NetworkInst(Instrument):
         """Initialize."""
         super().__init__(name, address)
 
-        # Validate IP
-        _ = ipaddress.ip_address(address)
+        # Validate IP, anything else is resolved as a hostname on connection
+        try:
+            _ = ipaddress.ip_address(address)
+        except ValueError:
+            log.info("Address %s is not an IP, using it as hostname.", address)
         self.port = port
         self.sleep = sleep
         self.timeout = timeout
         self.no_delay = no_delay
         self.__is_connected = False
-        self.socket = None
+        self.socket: Optional[socket.socket] = None
+        self._rxbuf = bytearray(RECV_SIZE)
+        self._pending = bytearray()
+        self._block = bytearray()
 
     def __del__(self):
         """Delete the object."""
@@ -51,11 +63,15 @@ class NetworkInst(Instrument):
             self.socket.setsockopt(
                 socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.no_delay)
             )
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUF_SIZE)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUF_SIZE)
             self.socket.connect((self.address, self.port))
+            self._pending = bytearray()
             self.__is_connected = True
-            log.info(f"Instrument {self.name} connected successfully.")
+            log.info("Instrument %s connected successfully.", self.name)
         else:
-            log.info(f"Instrument {self.name} already connected.")
+            log.info("Instrument %s already connected.", self.name)
 
     def disconnect(self):
         """Disconnect from the device."""
@@ -63,38 +79,144 @@ class NetworkInst(Instrument):
             self.socket.shutdown(socket.SHUT_RDWR)
             self.socket.close()
             self.__is_connected = False
-            log.info(f"Instrument {self.name} disconnected.")
+            log.info("Instrument %s disconnected.", self.name)
         else:
-            log.info(f"No connection to close for instrument {self.name}.")
+            log.info("No connection to close for instrument %s.", self.name)
 
-    def read(self) -> str:
-        """Read the output buffer of the instrument."""
-        response = b""
+    def _recv_into(self, buffer) -> int:
+        """Receive data into the buffer and return their size."""
         if self.socket is None:
+            raise ConnectionError(f"Instrument {self.name} not connected.")
+        n_bytes = self.socket.recv_into(buffer)
+        if not n_bytes:
+            raise ConnectionError(f"Connection closed by instrument {self.name}.")
+        return n_bytes
+
+    def _recv(self):
+        """Receive the available data and append them to the pending ones."""
+        n_bytes = self._recv_into(self._rxbuf)
+        self._pending += memoryview(self._rxbuf)[:n_bytes]
+
+    def _recv_at_least(self, n_bytes: int):
+        """Receive data until at least ``n_bytes`` are pending."""
+        while len(self._pending) < n_bytes:
+            self._recv()
+
+    def _read_line(self) -> bytes:
+        """Return the next pending line, without the terminator."""
+        start = 0
+        while (idx := self._pending.find(TERM, start)) < 0:
+            start = len(self._pending)
+            self._recv()
+        line = bytes(self._pending[:idx])
+        del self._pending[: idx + len(TERM)]
+        return line
+
+    def read_bytes(self) -> bytes:
+        """Read a line from the output buffer of the instrument without decoding it.
+
+        Data following the line terminator are kept for the next read. If the
+        timeout expires, the data received so far are kept as well.
+        """
+        self.flush()
+        if not self.__is_connected:
             log.warning("Socket not initialized.")
-            return ""
-        try:
-            while response[-1:] != b"\n":
-                response += self.socket.recv(1024)
-        except TimeoutError as exc:
-            raise exc
-        res = response.decode("utf-8").strip("\n")
-        log.debug(f"READ: {res}")
+            return b""
+        res = self._read_line()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("READ: %r", res)
         return res
 
-    def write(self, cmd: str, sleep=False):
-        """Write a message to the serial port."""
+    def read(self) -> str:
+        """Read a line from the output buffer of the instrument."""
+        return self.read_bytes().decode("utf-8")
+
+    def read_ieee_block(self) -> memoryview:
+        """Read a binary block in IEEE 488.2 definite length format.
+
+        The block is formatted as ``#<x><yyy><data><newline>``, where ``<x>`` is
+        the number of digits of ``<yyy>``, the length in bytes of ``<data>``.
+        The payload is read into a buffer reused across calls, so the returned view
+        is only valid until the next block read: copy it to keep the data.
+        """
+        self.flush()
+        if not self.__is_connected:
+            log.warning("Socket not initialized.")
+            return memoryview(b"")
+        self._recv_at_least(2)
+        if self._pending[:1] != b"#":
+            raise ValueError("Data in buffer is not in binblock format.")
+
+        n_digits = int(self._pending[1:2], 16)
+        if n_digits == 0:
+            # Indefinite length block, terminated by the newline
+            del self._pending[:2]
+            return memoryview(self._read_line())
+        self._recv_at_least(2 + n_digits)
+        n_bytes = int(self._pending[2 : 2 + n_digits])
+        del self._pending[: 2 + n_digits]
+
+        if len(self._block) < n_bytes:
+            self._block = bytearray(n_bytes)
+        data = memoryview(self._block)[:n_bytes]
+        # Take the payload already received, then receive the rest in place
+        n_read = min(n_bytes, len(self._pending))
+        data[:n_read] = self._pending[:n_read]
+        del self._pending[:n_read]
+        while n_read < n_bytes:
+            n_read += self._recv_into(data[n_read:])
+        self._recv_at_least(len(TERM))
+        if self._pending[: len(TERM)] != TERM:
+            raise ValueError("Data not terminated correctly.")
+        del self._pending[: len(TERM)]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("READ: block of %s bytes", n_bytes)
+        return data
+
+    def write(self, cmd: Union[str, bytes], sleep=False):
+        """Write a message to the instrument.
+
+        Commands given as bytes are sent without encoding.
+        """
+        if self._batch is not None:
+            self._batch.append(cmd)
+            return
         if self.socket is None:
             log.warning("Socket not initialized.")
             return
-        log.debug(f"WRITE: {cmd}")
-        self.socket.sendall((cmd + "\n").encode())
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("WRITE: %s", cmd)
+        data = cmd.encode() if isinstance(cmd, str) else cmd
+        self.socket.sendall(data + TERM)
         if sleep:
             time.sleep(self.sleep)
 
-    def query(self, cmd: str) -> str:
-        """Send a message, then read from the serial port."""
+    def write_many(self, cmds: Sequence[Union[str, bytes]]):
+        """Send multiple commands in a single message."""
+        self.write(TERM.join(c.encode() if isinstance(c, str) else c for c in cmds))
+
+    def query(self, cmd: str, pre_read_sleep: float = 0) -> str:
+        """Send a message, then read from the instrument.
+
+        The read waits for the terminator, ``pre_read_sleep`` seconds can be added
+        before it for devices needing time to process the command.
+        """
         if "?" not in cmd:
             raise ValueError('Query must include "?"')
-        self.write(cmd, True)
+        self.write(cmd)
+        if pre_read_sleep:
+            time.sleep(pre_read_sleep)
         return self.read()
+
+    def query_batch(self, cmds: List[str], pre_read_sleep: float = 0) -> List[str]:
+        """Send multiple queries in a single message, then read all the responses.
+
+        The responses are returned in the same order of the queries.
+        """
+        for cmd in cmds:
+            if "?" not in cmd:
+                raise ValueError('Query must include "?"')
+        self.write("\n".join(cmds))
+        if pre_read_sleep:
+            time.sleep(pre_read_sleep)
+        return [self.read() for _ in cmds]
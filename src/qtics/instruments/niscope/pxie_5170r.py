@@ -1,15 +1,41 @@
 """PXiE 5170R NI driver."""
 
 from abc import ABC, abstractmethod
+from copy import copy
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from queue import Queue
+from threading import Event, Thread
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional
 
 import niscope as ni
+import numpy as np
 
 from qtics import log
 from qtics.instruments import Instrument
 
 
+@lru_cache(maxsize=32)
+def _num_samples(duration: float, sample_rate: int) -> int:
+    """Return the number of samples acquired in the given duration."""
+    return int(duration * sample_rate)
+
+
+def _num_channels(channels) -> int:
+    """Return the number of channels in a channel list, such as 0, "0,1" or "0-3"."""
+    if isinstance(channels, (list, tuple, range)):
+        return sum(_num_channels(ch) for ch in channels)
+    count = 0
+    for item in str(channels).split(","):
+        first, sep, last = item.strip().replace(":", "-").partition("-")
+        if sep and first.isdigit() and last.isdigit():
+            count += abs(int(last) - int(first)) + 1
+        else:
+            count += 1
+    return count
+
+
 @dataclass
 class Trigger(ABC):
     """Abstract trigger object."""
@@ -92,19 +118,48 @@ class SoftwareTrigger(Trigger):
 class Pxie570R(Instrument):
     """Instrument class."""
 
-    def __init__(self, name: str, address: str):
+    _COUPLING_MAP = MappingProxyType(
+        {"AC": ni.VerticalCoupling.AC, "DC": ni.VerticalCoupling.DC}
+    )
+
+    def __init__(self, name: str, address: str, options: Optional[dict] = None):
         """Initialize."""
         super().__init__(name, address)
         self.voltage_range = 1
         self.coupling = "DC"
         self.sample_rate = int(250e9)  # Samples per second
         self.trigger = DigitalTrigger("ch1")  # TODO check this is reasonable
+        self.options = options if options is not None else {}
+        self._session: Optional[ni.Session] = None
+        self._last_config: Optional[tuple] = None
+        self._buffers: List[np.ndarray] = [np.empty(0), np.empty(0)]
+        self._buffer_idx = 0
+        self._ch_views: Dict[Any, Any] = {}
+
+    def __del__(self):
+        """Disconnect and delete."""
+        self.disconnect()
 
     def connect(self):
-        """Empty method to comply with interface."""
+        """Open a session with the device."""
+        if self._session is None:
+            self._session = ni.Session(self.address, options=self.options)
+            self._last_config = None
+            self._ch_views = {}
+            log.info(f"Instrument {self.name} connected successfully.")
+        else:
+            log.info(f"Instrument {self.name} already connected.")
 
     def disconnect(self):
-        """Empty method to comply with interface."""
+        """Close the session with the device."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+            self._last_config = None
+            self._ch_views = {}
+            log.info(f"Instrument {self.name} disconnected.")
+        else:
+            log.info(f"No connection to close for instrument {self.name}.")
 
     def write(self):
         """Empty method to comply with interface."""
@@ -118,6 +173,8 @@ class Pxie570R(Instrument):
     @property
     def available(self):
         """Check if instrument is available."""
+        if self._session is not None:
+            return True
         try:
             with ni.Session(self.address) as _:
                 return True
@@ -125,6 +182,13 @@ class Pxie570R(Instrument):
             log.error(e)
             return False
 
+    @property
+    def _open_session(self) -> ni.Session:
+        """Return the open session, raising if the instrument is not connected."""
+        if self._session is None:
+            raise RuntimeError(f"Instrument {self.name} not connected.")
+        return self._session
+
     @property
     def voltage_range(self):
         """The voltage_range property."""
@@ -141,9 +205,8 @@ class Pxie570R(Instrument):
 
     @coupling.setter
     def coupling(self, value: str):
-        # TODO: add validate
-        mapping = {"AC": ni.VerticalCoupling.AC, "DC": ni.VerticalCoupling.DC}
-        self._coupling = mapping[value]
+        self.validate_opt(value, ("AC", "DC"))
+        self._coupling = self._COUPLING_MAP[value]
 
     @property
     def sample_rate(self) -> int:
@@ -163,18 +226,125 @@ class Pxie570R(Instrument):
     def trigger(self, value: Trigger):
         self._trigger = value
 
+    def _configure(self, num_samples: int, ref_position: float, num_records: int = 1):
+        """Configure the session, skipping it if parameters did not change."""
+        config = (
+            self.voltage_range,
+            self.coupling,
+            self.sample_rate,
+            num_samples,
+            ref_position,
+            num_records,
+            self.trigger,
+        )
+        if config == self._last_config:
+            return
+        session = self._open_session
+        session.configure_vertical(range=self.voltage_range, coupling=self.coupling)
+        session.configure_horizontal_timing(
+            min_sample_rate=self.sample_rate,
+            min_num_pts=num_samples,
+            ref_position=ref_position,
+            num_records=num_records,
+            enforce_realtime=True,
+        )
+        if self.trigger:
+            self.trigger.configure(session)
+        # Copy the trigger, so that later changes to its fields are detected
+        self._last_config = config[:-1] + (copy(self.trigger),)
+
+    def _channel_view(self, channels):
+        """Return the channels view of the session, resolved only once."""
+        key = tuple(channels) if isinstance(channels, list) else channels
+        view = self._ch_views.get(key)
+        if view is None:
+            view = self._open_session.channels[channels]
+            self._ch_views[key] = view
+        return view
+
+    def _next_buffer(self, size: int) -> np.ndarray:
+        """Return the next of the two alternating acquisition buffers."""
+        self._buffer_idx ^= 1
+        if self._buffers[self._buffer_idx].size != size:
+            self._buffers[self._buffer_idx] = np.empty(size, dtype=np.float64)
+        return self._buffers[self._buffer_idx]
+
     def acquire(self, channels, duration, ref_position=50, options=None):
-        """Perform an acquisition."""
-        with ni.Session(self.address, options=options) as session:
-            num_samples = int(duration * self.sample_rate)
-            session.configure_vertical(range=self.voltage_range, coupling=self.coupling)
-            session.configure_horizontal_timing(
-                min_sample_rate=self.sample_rate,
-                min_num_pts=num_samples,
-                ref_position=ref_position,
-                num_records=1,
-                enforce_realtime=True,
-            )
-            if self.trigger:
-                self.trigger.configure(session)
-            return session.channels[channels].read(num_samples=num_samples)
+        """Perform an acquisition.
+
+        The session opened by :meth:`connect` is reused, and it is reconfigured
+        only if the acquisition parameters changed since the previous call.
+        Data are fetched into two alternating preallocated buffers: the samples
+        of the returned waveforms are views on them, valid until the second
+        following acquisition. Copy them if they have to be kept longer.
+        """
+        if options is not None and options != self.options:
+            self.disconnect()
+            self.options = options
+        if self._session is None:
+            self.connect()
+        num_samples = _num_samples(duration, self.sample_rate)
+        self._configure(num_samples, ref_position)
+        view = self._channel_view(channels)
+        buffer = self._next_buffer(num_samples * _num_channels(channels))
+        with self._open_session.initiate():
+            return view.fetch_into(buffer)
+
+    def acquire_continuous(
+        self, channels, duration, n_records, ref_position=50
+    ) -> Iterator[list]:
+        """Perform a multi-record acquisition, yielding the waveforms of each record.
+
+        Records are fetched by a background thread into two alternating buffers,
+        so that the fetch of a record overlaps with the processing of the
+        previous one. The samples of the yielded waveforms are valid only until
+        the next iteration.
+        """
+        if self._session is None:
+            self.connect()
+        num_samples = _num_samples(duration, self.sample_rate)
+        self._configure(num_samples, ref_position, n_records)
+        view = self._channel_view(channels)
+        size = num_samples * _num_channels(channels)
+
+        free: Queue = Queue()
+        for _ in range(2):
+            free.put(np.empty(size, dtype=np.float64))
+        ready: Queue = Queue()
+        stop = Event()
+
+        def _fetch():
+            try:
+                for record in range(n_records):
+                    buffer = free.get()
+                    if stop.is_set():
+                        return
+                    waveforms = view.fetch_into(
+                        buffer,
+                        relative_to=ni.FetchRelativeTo.PRETRIGGER,
+                        record_number=record,
+                        num_records=1,
+                    )
+                    ready.put((buffer, waveforms))
+            except (ni.Error, TimeoutError) as exc:
+                ready.put(exc)
+            finally:
+                ready.put(None)  # unblock the consumer if the thread stops early
+
+        with self._open_session.initiate():
+            thread = Thread(target=_fetch, daemon=True)
+            thread.start()
+            try:
+                for _ in range(n_records):
+                    item = ready.get()
+                    if isinstance(item, (ni.Error, TimeoutError)):
+                        raise item
+                    if item is None:
+                        raise RuntimeError("Fetch thread stopped unexpectedly.")
+                    buffer, waveforms = item
+                    yield waveforms
+                    free.put(buffer)
+            finally:
+                stop.set()
+                free.put(None)  # wake up the thread if it is waiting for a buffer
+                thread.join()
@@ -5,25 +5,24 @@ Controller of the Keithley2231A DC Power Supply.
 .. moduleauthor:: Marco Gobbo <marco.gobbo@mib.infn.it>
 """
 
-from qtics import log
-from qtics.instruments import SerialInst
+from qtics.instruments import SerialInst, cached_scpi
 
 
 class Keithley2231A(SerialInst):
     """Keithley Model 2231A-30-3 Triple Channel DC Power Supply by Keithley Instruments."""
 
+    __slots__ = ()
+
     def connect(self):
         """Put Keithley 2231A DC Power Supply in remote."""
-        self.serial.open()
+        super().connect()
         self.write("SYST:REM")
-        log.info(f"Instrument {self.name} connected successfully.")
 
     def disconnect(self):
         """Take Keithley 2231A DC Power Supply out of remote."""
-        if self.serial.is_open:
+        if self._is_open:
             self.write("SYST:LOC")
-            self.serial.close()
-            log.info(f"Instrument {self.name} disconnected.")
+        super().disconnect()
 
     @property
     def is_completed(self) -> bool:
@@ -41,54 +40,97 @@ class Keithley2231A(SerialInst):
     def load(self, memory: int):
         """Load the setups saved in the specified memory location."""
         self.write(f"*RCL {self.validate_range(memory, 0, 30)}")
+        self.invalidate()
 
     def wait(self):
         """Prevent the instrument from executing commands until all commands are completed."""
         self.write("*WAI")
 
-    @property
+    def snapshot(self) -> dict:
+        """Return channel, voltage, current and limits with a single query.
+
+        The queries following the first start with a colon to be resolved from
+        the root of the SCPI tree.
+        """
+        channel, voltage, current, voltage_limit, current_limit = self.query_many(
+            [
+                "INST:NSEL?",
+                ":SOUR:VOLT:LEV:IMM:AMPL?",
+                ":SOUR:CURR:LEV:IMM:AMPL?",
+                ":SOUR:VOLT:LIMIT:LEV?",
+                ":SOUR:CURR:LIMIT:LEV?",
+            ]
+        )
+        values = {
+            "channel": int(channel.split()[-1]),
+            "voltage": float(voltage),
+            "current": float(current),
+            "voltage_limit": float(voltage_limit),
+            "current_limit": float(current_limit),
+        }
+        self._cache.update(values)
+        return values
+
+    @cached_scpi
     def channel(self) -> int:
         """Select the channel to use."""
         return int(self.query("INST:NSEL?").split()[-1])
 
     @channel.setter
     def channel(self, ch: int):
-        self.write(f"INST:NSEL {self.validate_opt(ch, (1,2,3))}")
+        self.validate_opt(ch, (1, 2, 3))
+        self.write(f"INST:NSEL {ch}")
+        # Cached values refer to the previously selected channel
+        self.invalidate()
 
     @property
+    def _v_max(self) -> float:
+        """Maximum voltage of the selected channel.
+
+        The channel is read from the cache, so it is queried only on cold start.
+        """
+        return 5 if self.channel == 3 else 30
+
+    @cached_scpi
     def voltage(self) -> float:
         """Voltage of the selected the channel."""
-        return float(self.query("SOUR:VOLT:LEV:IMM:AMPL?"))
+        return self.query_float("SOUR:VOLT:LEV:IMM:AMPL?")
 
     @voltage.setter
     def voltage(self, value: float):
-        v_max = 5 if self.channel == 3 else 30
-        self.write(f"SOUR:VOLT:LEV:IMM:AMPL {self.validate_range(value, 0, v_max)}")
+        value = self.validate_range(value, 0, self._v_max)
+        self.write(f"SOUR:VOLT:LEV:IMM:AMPL {value}")
+        return value
 
-    @property
+    @cached_scpi
     def current(self) -> float:
         """Current of the selected the channel."""
-        return float(self.query("SOUR:CURR:LEV:IMM:AMPL?"))
+        return self.query_float("SOUR:CURR:LEV:IMM:AMPL?")
 
     @current.setter
     def current(self, value: float):
-        self.write(f"SOUR:CURR:LEV:IMM:AMPL {self.validate_range(value, 0, 3)}")
+        value = self.validate_range(value, 0, 3)
+        self.write(f"SOUR:CURR:LEV:IMM:AMPL {value}")
+        return value
 
-    @property
+    @cached_scpi
     def voltage_limit(self) -> float:
         """Voltage limit of the selected the channel."""
-        return float(self.query("SOUR:VOLT:LIMIT:LEV?"))
+        return self.query_float("SOUR:VOLT:LIMIT:LEV?")
 
     @voltage_limit.setter
     def voltage_limit(self, value: float):
-        v_max = 5 if self.channel == 3 else 30
-        self.write(f"SOUR:VOLT:LIMIT:LEV {self.validate_range(value, 0, v_max)}")
+        value = self.validate_range(value, 0, self._v_max)
+        self.write(f"SOUR:VOLT:LIMIT:LEV {value}")
+        return value
 
-    @property
+    @cached_scpi
     def current_limit(self) -> float:
         """Current limit of the selected the channel."""
-        return float(self.query("SOUR:CURR:LIMIT:LEV?"))
+        return self.query_float("SOUR:CURR:LIMIT:LEV?")
 
     @current_limit.setter
     def current_limit(self, value: float):
-        self.write(f"SOUR:VOLT:LIMIT:LEV {self.validate_range(value, 0, 3)}")
+        value = self.validate_range(value, 0, 3)
+        self.write(f"SOUR:CURR:LIMIT:LEV {value}")
+        return value
@@ -5,25 +5,26 @@ Controller of the Keithley6514 Electrometer.
 .. moduleauthor:: Marco Gobbo <marco.gobbo@mib.infn.it>
 """
 
-from qtics import log
 from qtics.instruments import SerialInst
 
 
 class Keithley6514(SerialInst):
     """Keithley 6514 Programmable Electrometer by Keithley Instruments."""
 
+    __slots__ = ()
+
+    _MEASURE_PARAMETERS = frozenset({"VOLT", "CURR", "RES", "CHAR"})
+
     def connect(self):
         """Put Keithley 6514 Electrometer in remote."""
-        self.serial.open()
+        super().connect()
         self.write("SYST:REM")
-        log.info(f"Instrument {self.name} connected successfully.")
 
     def disconnect(self):
         """Take Keithley 6514 Electrometer out of remote."""
-        if self.serial.is_open:
+        if self._is_open:
             self.write("SYST:LOC")
-            self.serial.close()
-            log.info(f"Instrument {self.name} disconnected.")
+        super().disconnect()
 
     def zcheck_on(self):
         """Enable zero check."""
@@ -52,9 +53,7 @@ class Keithley6514(SerialInst):
         - RES: Resistance measurement
         - CHAR: Charge measurement
         """
-        parameters = ("VOLT", "CURR", "RES", "CHAR")
-
-        if parameter in parameters:
+        if parameter in self._MEASURE_PARAMETERS:
             self.write(f"SENS:FUNC '{parameter}'", True)
             self.write(f"SENS:{parameter}:RANG:AUTO ON", True)
             self.set_zero()
@@ -64,8 +63,12 @@ class Keithley6514(SerialInst):
             )
 
     def read_data(self) -> float:
-        """Return the value of the parameter under measurement."""
-        self.write("FORM:ELEM READ", True)
-        self.write("ARM:COUNT 1", True)
-        self.write("READ?", True)
-        return float(self.read())
+        """Return the value of the parameter under measurement.
+
+        The commands are sent as a single compound command, so the ones following
+        the first start with a colon to be resolved from the root of the SCPI tree.
+        """
+        with self.batch():
+            self.write("FORM:ELEM READ")
+            self.write(":ARM:COUN 1")
+            return self.query_float(":READ?")
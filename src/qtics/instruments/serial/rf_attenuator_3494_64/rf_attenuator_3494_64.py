@@ -1,6 +1,6 @@
 """Attenuator349464."""
 
-from typing import Literal
+from typing import Literal, Optional
 
 import serial
 
@@ -10,6 +10,10 @@ from qtics.instruments import SerialInst
 class Attenuator_3494_64(SerialInst):
     """Control for the latching RF attenuator."""
 
+    __slots__ = ("_attenuation",)
+
+    _N_PINS = 11  # Attenuation bit pins 3-13
+
     def __init__(
         self,
         name: str,
@@ -25,7 +29,7 @@ class Attenuator_3494_64(SerialInst):
         super().__init__(
             name, address, baudrate, bytesize, parity, stopbits, timeout, sleep
         )
-        self._attenuation: float = 0.0
+        self._attenuation: Optional[float] = None
 
     @property
     def attenuation(self):
@@ -34,9 +38,18 @@ class Attenuator_3494_64(SerialInst):
 
     @attenuation.setter
     def attenuation(self, value: float):
-        self._attenuation = round(value, 2)
+        value = round(value, 2)
+        if value == self._attenuation:
+            return
+        self._attenuation = value
         self.write(f"ATT {value}")
 
+    def invalidate(self, *names):
+        """Clear the cached values, including the last written attenuation."""
+        super().invalidate(*names)
+        if not names or "attenuation" in names:
+            self._attenuation = None
+
     def get_pins_state(self):
-        """Get status of digital arduino pins."""
-        return self.query("DIG:PIN?")
+        """Get status of digital arduino pins, one per line."""
+        return "\n".join(self.query_lines("DIG:PIN?", self._N_PINS))
@@ -1,6 +1,7 @@
 """Python driver for an arduino-controlled RF switch."""
 
-from typing import Literal
+from numbers import Integral
+from typing import Iterable, Literal, Union, cast
 
 import serial
 
@@ -10,6 +11,10 @@ from qtics.instruments import SerialInst
 class Switch_R591(SerialInst):
     """Control for the latching RF switch R591722600."""
 
+    __slots__ = ("_pulse_lenght",)
+
+    _N_PINS = 7  # Switch pins 2-7 and reset pin 8
+
     def __init__(
         self,
         name: str,
@@ -27,7 +32,7 @@ class Switch_R591(SerialInst):
             name, address, baudrate, bytesize, parity, stopbits, timeout, sleep
         )
 
-        if self.serial.is_open:
+        if self._is_open:
             self.pulse_lenght = pulse_lenght
 
     @property
@@ -40,14 +45,18 @@ class Switch_R591(SerialInst):
         self._pulse_lenght = value
         self.write(f"PUL:LEN {value}")
 
-    def open(self, pin: int) -> None:
-        """Open port at specified pin."""
-        self.write(f"SWI:ON {pin}")
+    def open(self, pin: Union[int, Iterable[int]]) -> None:
+        """Open port at specified pin.
+
+        Multiple pins are opened with a single compound command.
+        """
+        pins = (pin,) if isinstance(pin, Integral) else cast(Iterable[int], pin)
+        self.write(";".join(f"SWI:ON {p}" for p in pins))
 
     def get_open_ports(self):
-        """Get currently open RF ports."""
-        return self.query("SWI:ON?")
+        """Get currently open RF ports, one per line."""
+        return "\n".join(self.query_lines("SWI:ON?"))
 
     def get_pins_state(self):
-        """Get status of digital arduino pins."""
-        return self.query("DIG:PIN?")
+        """Get status of digital arduino pins, one per line."""
+        return "\n".join(self.query_lines("DIG:PIN?", self._N_PINS))
@@ -9,7 +9,7 @@ from typing import Literal
 
 import serial
 
-from qtics.instruments import SerialInst
+from qtics.instruments import SerialInst, cached_scpi
 
 DEFAULT_FREQ_SCALE = 1e-3  # Convert mHz to Hz
 
@@ -17,6 +17,10 @@ DEFAULT_FREQ_SCALE = 1e-3  # Convert mHz to Hz
 class FSL0010(SerialInst):
     """FSL0010 QuickSyn microwave synthesizer by National Instruments."""
 
+    __slots__ = ()
+
+    _FREQ_RANGE = (0.65e9, 10e9)
+
     def __init__(
         self,
         name: str,
@@ -33,17 +37,18 @@ class FSL0010(SerialInst):
             name, address, baudrate, bytesize, parity, stopbits, timeout, sleep
         )
 
-    @property
+    @cached_scpi
     def freq(self) -> float:
         """Output signal frequency in Hz."""
-        return float(self.query("FREQ?")) * DEFAULT_FREQ_SCALE
+        return self.query_float("FREQ?") * DEFAULT_FREQ_SCALE
 
     @freq.setter
     def freq(self, freq: float):
-        freq = self.validate_range(freq, 0.65e9, 10e9)
+        freq = self.validate_range(freq, *self._FREQ_RANGE)
         self.write(f"FREQ {freq / DEFAULT_FREQ_SCALE}mlHz")
+        return freq
 
-    @property
+    @cached_scpi
     def output_on(self) -> bool:
         """Turn on RF output."""
         return self.query("OUTP:STAT?") == "ON"
@@ -54,8 +59,9 @@ class FSL0010(SerialInst):
             self.write("OUTP:STAT ON")
         else:
             self.write("OUTP:STAT OFF")
+        return bool(on)
 
-    @property
+    @cached_scpi
     def ext_ref_source(self) -> bool:
         """Use external reference source."""
         return self.query("ROSC:SOUR?") == "EXT"
@@ -66,8 +72,9 @@ class FSL0010(SerialInst):
             self.write("ROSC:SOUR EXT")
         else:
             self.write("ROSC:SOUR INT")
+        return bool(ext)
 
     @property
     def temperature(self) -> float:
         """Temperature in degrees Celsius."""
-        return float(self.query("DIAG:MEAS? 21"))
+        return self.query_float("DIAG:MEAS? 21")
@@ -16,6 +16,17 @@ class SIM928(SerialInst):
     Works in conjunction with the SIM900 mainframe.
     """
 
+    __slots__ = ("_mainframe_port", "_voltage")
+
+    _BATTERY_PARAMETERS = ("PNUM", "SERIAL", "MAXCY", "CYCLES", "PDATE")
+    _BATTERY_LABELS = (
+        "Battery pack part number",
+        "Battery pack serial number",
+        "Design life (number of charge cycles)",
+        "Charge cycles used",
+        "Battery pack production date (YYYY-MM-DD)",
+    )
+
     def __init__(
         self,
         name: str,
@@ -46,7 +57,7 @@ class SIM928(SerialInst):
         super().connect()
         time.sleep(self.sleep)
         self.connect_port(self._mainframe_port)
-        log.info(f"Instrument connected to port {self._mainframe_port}")
+        log.info("Instrument connected to port %s", self._mainframe_port)
 
     def connect_port(self, port: int):
         """Connect to the a specific port in the mainframe."""
@@ -59,14 +70,11 @@ class SIM928(SerialInst):
 
         Reset the mainframe before disconnecting to avoid problems when connecting again.
         """
-        if self.serial.is_open:
+        if self._is_open:
             self.write("esc")
             self.reset()
             time.sleep(self.sleep)
-            self.serial.close()
-            log.info(f"Instrument {self.name} disconnected.")
-        else:
-            log.info(f"No connection to close for instrument {self.name}.")
+        super().disconnect()
 
     def output_on(self):
         """Turn the output on."""
@@ -115,26 +123,20 @@ class SIM928(SerialInst):
         - CYCLES (3): # charge cycles used
         - PDATE (4): Battery pack production date (YYYY-MM-DD)
         """
-        parameters = ("PNUM", "SERIAL", "MAXCY", "CYCLES", "PDATE")
-
-        self.validate_opt(parameter, parameters)
+        self.validate_opt(parameter, self._BATTERY_PARAMETERS)
         return self.query("BIDN? " + parameter)
 
     def battery_full_spec(self):
-        """Print the full battery specifications."""
-        options = (
-            "Battery pack part number",
-            "Battery pack serial number",
-            "Design life (number of charge cycles)",
-            "Charge cycles used",
-            "Battery pack production date (YYYY-MM-DD)",
-        )
-
-        parameters = ("PNUM", "SERIAL", "MAXCY", "CYCLES", "PDATE")
+        """Print the full battery specifications.
 
-        for i in range(5):
-            print(options[i] + ": ")
-            print(self.battery_spec(parameters[i]))
+        All the parameters are read with a single compound query.
+        """
+        values = self.query_many(
+            [f"BIDN? {param}" for param in self._BATTERY_PARAMETERS]
+        )
+        for option, value in zip(self._BATTERY_LABELS, values):
+            print(option + ": ")
+            print(value)
 
     # Error commands
     def exe_error(self) -> str:
@@ -1,17 +1,31 @@
 """Base instrument for serial connections."""
 
+import logging
 import time
-from typing import Literal
+from typing import List, Literal, Optional, Sequence, Union
 
 import serial
 
 from qtics import log
 from qtics.instruments import Instrument
+from qtics.instruments._serial_reader import SerialReader
+
+TERM = b"\n"
+POLL_INTERVAL = 0.001  # Port polling period while waiting for multi-line replies
 
 
 class SerialInst(Instrument):
     """Base class for instrument controlled via serial connection."""
 
+    __slots__ = (
+        "serial",
+        "sleep",
+        "use_process_reader",
+        "_is_open",
+        "_reader",
+        "_pending",
+    )
+
     def __init__(
         self,
         name: str,
@@ -22,8 +36,13 @@ class SerialInst(Instrument):
         stopbits: int = serial.STOPBITS_ONE,
         timeout: int = 10,
         sleep: float = 0.1,
+        use_process_reader: bool = False,
     ):
-        """Initialize."""
+        """Initialize.
+
+        With ``use_process_reader`` the port is owned by a separate process that
+        continuously drains it, so replies are not lost while the interpreter is busy.
+        """
         super().__init__(name, address)
 
         self.serial = serial.Serial()
@@ -35,6 +54,10 @@ class SerialInst(Instrument):
         self.serial.timeout = timeout
 
         self.sleep = sleep
+        self.use_process_reader = use_process_reader
+        self._is_open = False
+        self._reader: Optional[SerialReader] = None
+        self._pending = bytearray()
 
     def __del__(self):
         """Disconnect and delete."""
@@ -42,38 +65,191 @@ class SerialInst(Instrument):
 
     def connect(self):
         """Connect to the device."""
-        if not self.serial.is_open:
-            self.serial.open()
-            log.info(f"Instrument {self.name} connected successfully.")
+        if not self._is_open:
+            if self.use_process_reader:
+                self._reader = SerialReader(
+                    self.serial.port, self.serial.get_settings()
+                )
+                self._reader.start(self.serial.timeout)
+            else:
+                self.serial.open()
+            self._is_open = True
+            self._pending.clear()
+            self.invalidate()
+            log.info("Instrument %s connected successfully.", self.name)
         else:
-            log.info(f"Instrument {self.name} already connected.")
+            log.info("Instrument %s already connected.", self.name)
 
     def disconnect(self):
         """Disconnect from the device."""
-        if self.serial.is_open:
-            self.serial.close()
-            log.info(f"Instrument {self.name} disconnected.")
+        if self._is_open:
+            if self._reader is not None:
+                self._reader.stop()
+                self._reader = None
+            else:
+                self.serial.close()
+            self._is_open = False
+            log.info("Instrument %s disconnected.", self.name)
         else:
-            log.info(f"No connection to close for instrument {self.name}.")
+            log.info("No connection to close for instrument %s.", self.name)
 
-    def write(self, cmd, sleep=False):
-        """Write a message to the serial port."""
-        if self.serial.is_open:
-            log.debug(f"WRITE: {cmd}")
-            self.serial.write((cmd + "\n").encode())
+    def write(self, cmd: Union[str, bytes], sleep=False):
+        """Write a message to the serial port.
+
+        Commands given as bytes are sent without encoding.
+        """
+        if self._batch is not None:
+            self._batch.append(cmd)
+            return
+        if self._is_open:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("WRITE: %s", cmd)
+            data = cmd.encode() if isinstance(cmd, str) else cmd
+            if self._reader is not None:
+                self._reader.write(data + TERM)
+            else:
+                self.serial.write(data + TERM)
             if sleep:
                 time.sleep(self.sleep)
 
-    def read(self) -> str:
-        """Read a message from the serial port."""
-        if self.serial.is_open:
-            raw = self.serial.read(self.serial.in_waiting)
-            res = raw.decode("utf-8").strip("\n")
-            log.debug(f"READ: {res}")
+    def write_many(self, cmds: Sequence[Union[str, bytes]]):
+        """Send multiple commands as a single compound command."""
+        self.write(b";".join(c.encode() if isinstance(c, str) else c for c in cmds))
+
+    def _read_until_term(self) -> bytes:
+        """Read from the serial port until the terminator or the timeout.
+
+        Data received after the terminator are kept for the following read.
+        """
+        self.flush()
+        if self._reader is not None:
+            return self._reader.read_until(TERM, self.serial.timeout)
+        buf = self._pending
+        timeout = self.serial.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while TERM not in buf:
+            buf.extend(self.serial.read(max(1, self.serial.in_waiting)))
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+        idx = buf.find(TERM)
+        end = len(buf) if idx < 0 else idx + len(TERM)
+        frame = bytes(buf[:end])
+        del buf[:end]
+        return frame
+
+    def _read_until_quiet(self, quiet: float) -> bytes:
+        """Read from the serial port until no data are received for ``quiet`` seconds."""
+        self.flush()
+        if self._reader is not None:
+            buf = bytearray()
+            while frame := self._reader.read_until(TERM, quiet):
+                buf.extend(frame)
+            return bytes(buf)
+        buf = self._pending
+        timeout = self.serial.timeout
+        now = last = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        while now - last < quiet and (deadline is None or now < deadline):
+            waiting = self.serial.in_waiting
+            if waiting:
+                buf.extend(self.serial.read(waiting))
+                last = time.monotonic()
+            else:
+                time.sleep(POLL_INTERVAL)
+            now = time.monotonic()
+        frame = bytes(buf)
+        buf.clear()
+        return frame
+
+    def read_bytes(self) -> bytes:
+        """Read a message from the serial port without decoding it.
+
+        Data are read until the terminator is received or the timeout expires.
+        """
+        if self._is_open:
+            res = self._read_until_term().strip(TERM)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("READ: %r", res)
             return res
-        return ""
+        return b""
+
+    def read(self) -> str:
+        """Read a message from the serial port.
 
-    def query(self, cmd) -> str:
-        """Send a message, then read from the serial port."""
-        self.write(cmd, sleep=True)
+        Data are read until the terminator is received or the timeout expires.
+        """
+        return self.read_bytes().decode("utf-8")
+
+    def read_lines(
+        self, n_lines: Optional[int] = None, quiet: Optional[float] = None
+    ) -> List[str]:
+        """Read a response made of multiple lines.
+
+        With ``n_lines`` the given number of lines is read, otherwise lines are
+        read until nothing is received for ``quiet`` seconds (``sleep`` by default).
+        """
+        if not self._is_open:
+            return []
+        if n_lines is not None:
+            raw = b"".join(self._read_until_term() for _ in range(n_lines))
+        else:
+            raw = self._read_until_quiet(self.sleep if quiet is None else quiet)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("READ: %r", raw)
+        return raw.decode("utf-8").splitlines()
+
+    def query(self, cmd, pre_read_sleep: float = 0) -> str:
+        """Send a message, then read from the serial port.
+
+        The read waits for the terminator, ``pre_read_sleep`` seconds can be added
+        before it for devices needing time to process the command.
+        """
+        self.write(cmd)
+        if pre_read_sleep:
+            time.sleep(pre_read_sleep)
         return self.read()
+
+    def query_lines(
+        self, cmd, n_lines: Optional[int] = None, quiet: Optional[float] = None
+    ) -> List[str]:
+        """Send a message, then read a response made of multiple lines.
+
+        See :meth:`read_lines` for the meaning of ``n_lines`` and ``quiet``.
+        """
+        self.write(cmd)
+        return self.read_lines(n_lines, quiet)
+
+    def query_float(self, cmd, pre_read_sleep: float = 0) -> float:
+        """Send a message, then parse the numeric response.
+
+        The response is converted without decoding it to a string.
+        """
+        if not self._is_open:
+            raise ConnectionError(
+                f"Instrument {self.name} not connected, cannot query {cmd}."
+            )
+        self.write(cmd)
+        if pre_read_sleep:
+            time.sleep(pre_read_sleep)
+        res = self._read_until_term()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("READ: %r", res)
+        try:
+            return float(res)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid response {res!r} of instrument {self.name} to {cmd}."
+            ) from exc
+
+    def query_many(self, cmds: List[str], pre_read_sleep: float = 0) -> List[str]:
+        """Send multiple queries as a single compound command, then split the response.
+
+        If the instrument does not return one value per query, the rest of the
+        response is discarded and the queries are sent again one by one.
+        """
+        values = self.query(";".join(cmds), pre_read_sleep).split(";")
+        if len(values) != len(cmds):
+            log.warning("Compound query not supported, sending queries one by one.")
+            self._read_until_quiet(self.sleep)
+            values = [self.query(cmd, pre_read_sleep) for cmd in cmds]
+        return values
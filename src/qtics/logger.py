@@ -11,10 +11,6 @@ class CustomHandler(logging.StreamHandler):
     def __init__(self):
         """Initialize custom handler."""
         super().__init__()
-        self.FORMATS = None
-
-    def format(self, record):
-        """Format the record with specific format."""
         fmt = "[%(levelname)s|%(asctime)s]: %(message)s"
 
         grey = "\x1b[38;20m"
@@ -24,15 +20,23 @@ class CustomHandler(logging.StreamHandler):
         bold_red = "\x1b[31;1m"
         reset = "\x1b[0m"
 
-        self.FORMATS = {
-            logging.DEBUG: green + fmt + reset,
-            logging.INFO: grey + fmt + reset,
-            logging.WARNING: yellow + fmt + reset,
-            logging.ERROR: red + fmt + reset,
-            logging.CRITICAL: bold_red + fmt + reset,
+        self._formatters = {
+            level: logging.Formatter(color + fmt + reset, datefmt="%Y-%m-%d %H:%M:%S")
+            for level, color in (
+                (logging.DEBUG, green),
+                (logging.INFO, grey),
+                (logging.WARNING, yellow),
+                (logging.ERROR, red),
+                (logging.CRITICAL, bold_red),
+            )
         }
-        log_fmt = self.FORMATS.get(record.levelno)
-        return logging.Formatter(log_fmt, datefmt="%Y-%m-%d %H:%M:%S").format(record)
+        self._default_formatter = logging.Formatter(datefmt="%Y-%m-%d %H:%M:%S")
+
+    def format(self, record):
+        """Format the record with specific format."""
+        return self._formatters.get(record.levelno, self._default_formatter).format(
+            record
+        )
 
 
 qtics_log = logging.getLogger(__name__)
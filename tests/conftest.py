@@ -0,0 +1,107 @@
+"""Shared test fixtures."""
+
+import socket
+from unittest import mock
+
+import pytest
+import serial
+
+_MOCK_REPLY = b"test_read\n"
+
+
+class _FakeSerial(serial.Serial):
+    """Serial port answering every query with a fixed reply."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.reply = _MOCK_REPLY
+        self.replies = {}
+        self.written = []
+        self.rx = bytearray()
+
+    @property
+    def in_waiting(self):
+        """Number of bytes received and not read yet."""
+        return len(self.rx)
+
+    def open(self):
+        """Open the port."""
+
+    def close(self):
+        """Close the port."""
+
+    def write(self, data):
+        """Write data to the port, the reply to a query is received right after.
+
+        Commands found in ``replies`` get their own reply instead of the fixed one.
+        """
+        self.written.append(data)
+        if b"?" in data:
+            self.rx.extend(self.replies.get(data, self.reply))
+        return len(data)
+
+    def read(self, size=1):
+        """Read from the port, the reply is sent again if nothing is pending."""
+        if not self.rx:
+            self.rx.extend(self.reply)
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+
+
+@pytest.fixture(scope="class")
+def fake_serial():
+    """Replace the serial port class with a fake one for the whole class."""
+    with mock.patch.object(serial, "Serial", _FakeSerial):
+        yield
+
+
+class _StubSocket:
+    """Socket without kernel resources, replying to every read with a message."""
+
+    def __init__(self, *_):
+        """Initialize."""
+        self.timeout = None
+        self.options = {}
+        self.reply = _MOCK_REPLY
+        self.replies = {}
+        self.sent = []
+
+    def settimeout(self, timeout):
+        """Set the socket timeout."""
+        self.timeout = timeout
+
+    def setsockopt(self, level, option, value):
+        """Set a socket option."""
+        self.options[level, option] = value
+
+    def getsockopt(self, level, option):
+        """Get a socket option."""
+        return self.options.get((level, option), 0)
+
+    def connect(self, _):
+        """Connect to the address."""
+
+    def sendall(self, data):
+        """Send data."""
+        self.sent.append(data)
+
+    def recv_into(self, buffer):
+        """Copy the reply into the buffer."""
+        data = self.reply
+        buffer[: len(data)] = data
+        return len(data)
+
+    def shutdown(self, _):
+        """Shut down the connection."""
+
+    def close(self):
+        """Close the socket."""
+
+
+@pytest.fixture(scope="class")
+def stub_socket():
+    """Replace the socket class with a stub for the whole class."""
+    with mock.patch.object(socket, "socket", _StubSocket):
+        yield
@@ -0,0 +1,101 @@
+"""Test parallel dispatcher and asynchronous calls."""
+
+import asyncio
+from threading import Barrier
+from typing import Optional
+
+import pytest
+
+from qtics.instruments import Instrument, ParallelDispatcher
+
+
+class SlowInstrument(Instrument):
+    """Dummy instrument whose writes wait for the other instruments ones."""
+
+    def __init__(self, name: str, address: str, barrier: Optional[Barrier] = None):
+        """Initialize."""
+        super().__init__(name, address)
+        self.barrier = barrier
+        self.written = []
+
+    def connect(self):
+        """Connect to the instrument."""
+
+    def disconnect(self):
+        """Disconnect from the instrument."""
+
+    def write(self, cmd, sleep=False):
+        """Send a command to the instrument."""
+        if self.barrier is not None:
+            # Raise BrokenBarrierError if the writes do not overlap
+            self.barrier.wait(timeout=5)
+        self.written.append(cmd)
+        return cmd
+
+    def read(self):
+        """Read from the instrument."""
+        raise RuntimeError("Read failed")
+
+    def query(self, cmd) -> str:
+        """Send a command and read from the instrument."""
+        self.write(cmd)
+        return self.read()
+
+
+def test_submit():
+    """Test parallel execution and ordering."""
+    barrier = Barrier(2)
+    inst1 = SlowInstrument("inst1", "address", barrier)
+    inst2 = SlowInstrument("inst2", "address", barrier)
+    with ParallelDispatcher() as dispatcher:
+        dispatcher.submit(inst1, "write", "cmd1")
+        dispatcher.submit(inst2, "write", "cmd1")
+        dispatcher.submit(inst1, "write", "cmd2")
+        dispatcher.submit(inst2, "write", "cmd2")
+        assert dispatcher.wait() == ["cmd1", "cmd1", "cmd2", "cmd2"]
+    assert inst1.written == ["cmd1", "cmd2"]
+    assert inst2.written == ["cmd1", "cmd2"]
+
+
+def test_exception():
+    """Test exceptions are propagated."""
+    with ParallelDispatcher() as dispatcher:
+        dispatcher.submit(SlowInstrument("inst", "address"), "read")
+        with pytest.raises(RuntimeError):
+            dispatcher.wait()
+
+
+def test_async_calls():
+    """Test asynchronous calls run concurrently."""
+    barrier = Barrier(2)
+    inst1 = SlowInstrument("inst1", "address", barrier)
+    inst2 = SlowInstrument("inst2", "address", barrier)
+
+    async def _main():
+        return await asyncio.gather(
+            inst1.acall("write", "cmd"),
+            inst2.acall("write", "cmd"),
+            inst1.aget("name"),
+            inst2.aset(address="new_address"),
+        )
+
+    results = asyncio.run(_main())
+    assert results == ["cmd", "cmd", {"name": "inst1"}, None]
+    assert inst2.address == "new_address"
+
+
+def test_async_io():
+    """Test asynchronous I/O methods."""
+    inst1 = SlowInstrument("inst1", "address")
+    inst2 = SlowInstrument("inst2", "address")
+
+    async def _main():
+        await asyncio.gather(inst1.aconnect(), inst2.aconnect())
+        await asyncio.gather(inst1.awrite("cmd"), inst2.awrite("cmd"))
+        with pytest.raises(RuntimeError):
+            await inst1.aquery("cmd?")
+        await asyncio.gather(inst1.adisconnect(), inst2.adisconnect())
+
+    asyncio.run(_main())
+    assert inst1.written == ["cmd", "cmd?"]
+    assert inst2.written == ["cmd"]
@@ -0,0 +1,70 @@
+"""Test behaviour shared by all the instrument base classes."""
+
+import pytest
+
+from qtics.instruments import Instrument, NetworkInst, SerialInst
+
+ABSTRACT_METHODS = ("connect", "disconnect", "write", "read", "query")
+
+
+class BareInstrument(Instrument):
+    """Minimal concrete instrument."""
+
+    def connect(self):
+        """Connect to the instrument."""
+
+    def disconnect(self):
+        """Disconnect from the instrument."""
+
+    def write(self, cmd, sleep=False):
+        """Send a command to the instrument."""
+
+    def read(self):
+        """Read from the instrument."""
+        return ""
+
+    def query(self, cmd) -> str:
+        """Send a command and read from the instrument."""
+        return self.read()
+
+
+def mock_query(_, cmd):
+    """Mock query function."""
+    return f"ID {cmd}"
+
+
+@pytest.fixture(
+    scope="module",
+    params=[BareInstrument, NetworkInst, SerialInst],
+    ids=["instrument", "network", "serial"],
+)
+def base_inst(request):
+    """Instrument of each base class, shared by tests not modifying its state."""
+    return request.param("name_inst", "address")
+
+
+def test_init(base_inst):
+    """Test initialization."""
+    assert isinstance(base_inst, Instrument)
+    assert base_inst.name == "name_inst"
+    assert base_inst.address == "address"
+    assert base_inst.defaults == {}
+
+
+def test_get_id(base_inst, monkeypatch):
+    """Test get_id function."""
+    monkeypatch.setattr(type(base_inst), "query", mock_query)
+    assert base_inst.get_id() == "ID *IDN?"
+
+
+@pytest.mark.parametrize("method", ABSTRACT_METHODS)
+def test_abstract_methods(method):
+    """Test instruments must implement every I/O method."""
+    namespace = {
+        name: getattr(BareInstrument, name)
+        for name in ABSTRACT_METHODS
+        if name != method
+    }
+    incomplete = type("IncompleteInstrument", (Instrument,), namespace)
+    with pytest.raises(TypeError, match=method):
+        incomplete("name_inst", "address")
@@ -1,12 +1,16 @@
 """Test experiment class."""
 
-from time import sleep
+from concurrent.futures import wait
+from threading import Event
+from typing import Optional
+from unittest import mock
 
 import h5py
 import numpy as np
 import pytest
 
-from qtics.experiment import BaseExperiment, Experiment, MonitorExperiment
+from qtics import experiment as experiment_module
+from qtics.experiment import BaseExperiment, Clock, Experiment, MonitorExperiment
 from qtics.instruments import Instrument
 
 
@@ -44,10 +48,19 @@ class DummyExperiment(Experiment):
 
     def main(self):
         """Run main part of the experiment."""
-        sleep(0.2)
+        self.clock.sleep(0.2)
         _ = self.monitor_failed()
 
 
+class FailingExperiment(DummyExperiment):
+    """Dummy experiment failing after writing data."""
+
+    def main(self):
+        """Write data, then fail."""
+        self.append_data_group("group1", datasets={"data": [1, 2, 3]})
+        raise RuntimeError("Acquisition failed")
+
+
 class DummyMonitor(MonitorExperiment):
     """Dummy monitor experiment class."""
 
@@ -61,6 +74,27 @@ class DummyMonitor(MonitorExperiment):
             raise RuntimeError("Read value over allowed maximum")
 
 
+class FakeClock(Clock):
+    """Clock returning immediately."""
+
+    sleep = staticmethod(lambda _: None)
+
+
+class EventClock(Clock):
+    """Clock returning as soon as an event is set."""
+
+    def __init__(self, event: Event, sleeping: Optional[Event] = None):
+        """Initialize."""
+        self.event = event
+        self.sleeping = sleeping
+
+    def sleep(self, seconds: float):
+        """Wait until the event is set or the time has passed."""
+        if self.sleeping is not None:
+            self.sleeping.set()
+        self.event.wait(seconds)
+
+
 @pytest.fixture
 def instrument():
     """Dummy instrument fixture."""
@@ -71,13 +105,15 @@ def instrument():
 def experiment(tmpdir):
     """Dummy experiment fixture."""
     datafile = str(tmpdir.join("datafile.hdf5"))
-    return DummyExperiment("exp", data_file="datafile.hdf5", data_dir=str(tmpdir))
+    return DummyExperiment(
+        "exp", data_file="datafile.hdf5", data_dir=str(tmpdir), clock=FakeClock()
+    )
 
 
 @pytest.fixture
 def monitor():
     """Dummy monitor fixture."""
-    return DummyMonitor("testmonitor")
+    return DummyMonitor("testmonitor", clock=FakeClock())
 
 
 def test_init(experiment, tmpdir):
@@ -124,6 +160,7 @@ def test_append_data_group(experiment):
     attributes = {"attr1": "value1", "attr2": "value2"}
 
     experiment.append_data_group("group1", datasets=datasets, **attributes)
+    experiment.close_data_file()
 
     with h5py.File(experiment.data_file, "r") as file:
         assert "group1" in file
@@ -147,6 +184,22 @@ def test_get_datasets_dict(experiment):
     experiment.save_config()
     data = experiment.get_datasets_dict()
     assert data == {"group1": {"data1": np.asarray(3), "data2": np.asarray(5)}}
+    experiment.close_data_file()
+    assert experiment.get_datasets_dict() == data
+
+
+def test_compressed_datasets(experiment):
+    """Test numeric arrays are stored chunked and compressed."""
+    trace = np.linspace(0, 1, 1001)
+    experiment.append_data_group("group1", datasets={"trace": trace, "label": "a"})
+    experiment.append_data_group("group2", datasets={"trace": trace})
+    experiment.close_data_file()
+
+    with h5py.File(experiment.data_file, "r") as file:
+        assert file["group1/trace"].compression == "lzf"
+        assert file["group1/trace"].chunks is not None
+        assert file["group1/label"].compression is None
+        assert np.array_equal(file["group2/trace"], trace)
 
 
 def test_save_config(experiment):
@@ -154,6 +207,7 @@ def test_save_config(experiment):
     experiment.instrument1.update_defaults(address="default address")
     experiment.instrument1.set_defaults()
     experiment.save_config()
+    experiment.close_data_file()
     with h5py.File(experiment.data_file, "r") as file:
         assert "config" in file
         config = file["config"]
@@ -177,7 +231,41 @@ def test_successful_run(experiment, monitor):
 def test_unsuccessful_run(experiment, monitor):
     """Test run with monitor failure."""
     monitor.max_read = 0
+    main_started = Event()
+    experiment.clock = EventClock(experiment.event, sleeping=main_started)
+    monitor.clock = EventClock(main_started)
     experiment.instrument1.update_defaults(name="reset occurred")
     experiment.add_monitor(monitor)
     experiment.run()
     assert experiment.instrument1.name == "reset occurred"
+
+
+@pytest.fixture
+def failing_experiment(tmpdir, monitor):
+    """Failing experiment fixture, with a monitor."""
+    exp = FailingExperiment(
+        "exp", data_file="datafile.hdf5", data_dir=str(tmpdir), clock=FakeClock()
+    )
+    exp.add_monitor(monitor)
+    return exp
+
+
+def test_failed_step_closes_file(failing_experiment):
+    """Test the data file is closed when the main part fails."""
+    failing_experiment.run()
+    with h5py.File(failing_experiment.data_file, "w"):
+        pass
+
+
+def test_interrupted_run_closes_file(failing_experiment):
+    """Test the data file is closed when the run is interrupted."""
+
+    def interrupted_wait(futures, return_when):
+        wait(futures[-1:])
+        raise KeyboardInterrupt
+
+    with mock.patch.object(experiment_module, "wait", interrupted_wait):
+        with pytest.raises(KeyboardInterrupt):
+            failing_experiment.run()
+    with h5py.File(failing_experiment.data_file, "w"):
+        pass
@@ -0,0 +1,99 @@
+"""Test instrument base class."""
+
+import pytest
+
+from qtics.instruments import Instrument, cached_scpi
+
+
+class DummyInstrument(Instrument):
+    """Dummy instrument class counting the queries."""
+
+    def __init__(self, name: str, address: str):
+        """Initialize."""
+        super().__init__(name, address)
+        self.n_queries = 0
+        self.written = []
+
+    def connect(self):
+        """Connect to the instrument."""
+
+    def disconnect(self):
+        """Disconnect from the instrument."""
+
+    def write(self, cmd, sleep=False):
+        """Send a command to the instrument."""
+        self.written.append(cmd)
+
+    def read(self):
+        """Read from the instrument."""
+        return "1.5"
+
+    def query(self, cmd) -> str:
+        """Send a command and read from the instrument."""
+        self.n_queries += 1
+        self.write(cmd)
+        return self.read()
+
+    @cached_scpi
+    def level(self) -> float:
+        """Cached property."""
+        return float(self.query("LEV?"))
+
+    @level.setter
+    def level(self, value: float):
+        value = self.validate_range(value, 0, 10)
+        self.write(f"LEV {value}")
+        return value
+
+
+@pytest.fixture
+def inst():
+    """Dummy instrument fixture."""
+    return DummyInstrument("name_inst", "address")
+
+
+def test_cached_get(inst):
+    """Test the instrument is queried only once."""
+    assert inst.level == 1.5
+    assert inst.level == 1.5
+    assert inst.n_queries == 1
+
+
+def test_cached_set(inst):
+    """Test the written value is cached."""
+    inst.level = 20
+    assert inst.written == ["LEV 10"]
+    assert inst.level == 10
+    assert inst.n_queries == 0
+
+
+def test_skip_same_value(inst):
+    """Test writing the cached value is skipped."""
+    inst.level = 3
+    inst.level = 3
+    assert inst.written == ["LEV 3"]
+    inst.invalidate()
+    inst.level = 3
+    assert inst.written == ["LEV 3", "LEV 3"]
+
+
+def test_invalidate(inst):
+    """Test cache invalidation."""
+    inst.level = 3
+    inst.invalidate("level")
+    assert inst.level == 1.5
+    inst.level = 3
+    inst.invalidate()
+    assert inst.level == 1.5
+    inst.level = 3
+    inst.reset()
+    assert inst.level == 1.5
+    assert inst.n_queries == 3
+
+
+def test_refresh(inst):
+    """Test refresh function."""
+    inst.level = 3
+    assert inst.refresh() == {"level": 1.5}
+    assert inst.refresh("level") == {"level": 1.5}
+    assert inst.n_queries == 2
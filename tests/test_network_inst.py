@@ -1,46 +1,46 @@
 """Test network instrument base class."""
 
+import copy
 import socket
 
 import pytest
 
-from qtics.instruments import Instrument, NetworkInst
+from qtics.instruments import NetworkInst
 
 
-def mock_pass(_=None, __=None):
-    """Mock function with no return."""
-    pass
-
-
-def mock_read(_, __):
-    """Mock read function."""
-    return b"test_read\n"
+@pytest.fixture(scope="class")
+def _network_inst_template(stub_socket):
+    """Build the instrument once for the whole class."""
+    return NetworkInst("name_inst", "address")
 
 
+@pytest.mark.usefixtures("stub_socket")
 class TestNetworklInst:
     """Test class for NetworkInst."""
 
     @pytest.fixture
-    def network_inst(self, mocker):
-        """Patch functions used in other methods."""
-        mocker.patch("ipaddress.ip_address", new_callable=lambda: mock_pass)
-        mocker.patch("socket.socket.connect", new_callable=lambda: mock_pass)
-        mocker.patch("socket.socket.shutdown", new_callable=lambda: mock_pass)
-        mocker.patch("socket.socket.close", new_callable=lambda: mock_pass)
-        return NetworkInst("name_inst", "address")
-
-    def test_init(self, network_inst):
+    def network_inst(self, _network_inst_template):
+        """Copy of the instrument template with its own defaults and cache."""
+        inst = copy.copy(_network_inst_template)
+        inst._defaults = {}
+        inst._cache = {}
+        return inst
+
+    def test_init(self, _network_inst_template):
         """Test initialization."""
-        inst = network_inst
+        inst = _network_inst_template
         assert isinstance(inst, NetworkInst)
-        assert isinstance(inst, Instrument)
-        assert inst.name == "name_inst"
-        assert inst.address == "address"
         assert inst.port == 5025
         assert inst.sleep == 0.1
         assert inst.no_delay == True
         assert inst.timeout == 10
 
+    def test_hostname(self):
+        """Test initialization with a hostname."""
+        inst = NetworkInst("name_inst", "instrument.local")
+        assert inst.address == "instrument.local"
+
+    @pytest.mark.slow
     def test_del(self, network_inst):
         """Test destructor."""
         inst = network_inst
@@ -51,11 +51,12 @@ class TestNetworklInst:
         """Test connect function."""
         inst = network_inst
         inst.connect()
-        assert isinstance(inst.socket, socket.socket)
+        assert hasattr(inst.socket, "sendall")
         assert inst.timeout == inst.socket.timeout
         assert inst.no_delay == bool(
             inst.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
         )
+        assert inst.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
 
     def test_disconnect(self, network_inst):
         """Test disconnect function."""
@@ -63,59 +64,121 @@ class TestNetworklInst:
         inst.connect()
         inst.disconnect()
 
-    def test_write(self, network_inst, mocker):
+    def test_write(self, network_inst):
         """Test write function."""
-        mocker.patch("socket.socket.sendall", new_callable=lambda: mock_pass)
         inst = network_inst
         inst.connect()
         inst.write("test_cmd")
 
-    def test_read(self, network_inst, mocker):
+    def test_read(self, network_inst):
         """Test read function."""
-        mocker.patch("socket.socket.recv", new_callable=lambda: mock_read)
         inst = network_inst
         inst.connect()
         assert inst.read() == "test_read"
+        assert inst.read_bytes() == b"test_read"
+
+    def test_read_ieee_block(self, network_inst):
+        """Test binary block read."""
+        inst = network_inst
+        inst.connect()
+        inst.socket.reply = b"#15abcde\n"
+        assert inst.read_ieee_block() == b"abcde"
+
+    def test_read_after_timeout(self, network_inst):
+        """Test a timed out read does not break the following ones."""
+        inst = network_inst
+        inst.connect()
+        chunks = [b"par", socket.timeout(), b"tial\nnext", b"\n"]
+
+        def recv_into(buffer):
+            chunk = chunks.pop(0)
+            if isinstance(chunk, Exception):
+                raise chunk
+            buffer[: len(chunk)] = chunk
+            return len(chunk)
+
+        inst.socket.recv_into = recv_into
+        with pytest.raises(TimeoutError):
+            inst.read()
+        assert inst.read() == "partial"
+        assert inst.read() == "next"
+        assert chunks == []
+
+    def test_read_ieee_block_chunks(self, network_inst):
+        """Test binary block read with the block split in multiple chunks."""
+        inst = network_inst
+        inst.connect()
+        chunks = [b"#", b"210ab", b"cdefgh", b"ij", b"\nnext\n"]
+
+        def recv_into(buffer):
+            chunk = chunks.pop(0)
+            buffer[: len(chunk)] = chunk
+            return len(chunk)
+
+        inst.socket.recv_into = recv_into
+        assert inst.read_ieee_block() == b"abcdefghij"
+        assert inst.read() == "next"
+        inst.socket.recv_into = lambda _: 0
+        with pytest.raises(ConnectionError):
+            inst.read()
 
-    def test_query(self, network_inst, mocker):
+    def test_query(self, network_inst):
         """Test query function."""
-        mocker.patch("socket.socket.recv", new_callable=lambda: mock_read)
-        mocker.patch("socket.socket.sendall", new_callable=lambda: mock_pass)
         inst = network_inst
         inst.connect()
         assert inst.query("CMD?") == "test_read"
         with pytest.raises(ValueError):
             inst.query("CMD")
 
+    def test_query_batch(self, network_inst):
+        """Test query_batch function."""
+        inst = network_inst
+        inst.connect()
+        assert inst.query_batch(["CMD1?", "CMD2?"]) == ["test_read", "test_read"]
+        with pytest.raises(ValueError):
+            inst.query_batch(["CMD1?", "CMD2"])
+
+    def test_batch(self, network_inst):
+        """Test batched writes."""
+        inst = network_inst
+        inst.connect()
+        written = inst.socket.sent
+        with inst.batch():
+            inst.write("cmd1")
+            inst.write("cmd2")
+            inst.write(b"cmd3")
+            assert written == []
+        assert written == [b"cmd1\ncmd2\ncmd3\n"]
+
     def test_validate_opt(self, network_inst):
         """Test validate_opt function."""
         inst = network_inst
         with pytest.raises(RuntimeError):
             inst.validate_opt("OPT3", ("OPT1", "OPT2"))
 
-    def test_validate_range(self, network_inst):
+    @pytest.mark.parametrize("value, expected", [(19.3, 19.3), (-19.3, 1), (193, 100)])
+    def test_validate_range(self, network_inst, value, expected):
         """Test validate_range function."""
-        inst = network_inst
-        assert inst.validate_range(19.3, 1, 100) == 19.3
-        assert inst.validate_range(-19.3, 1, 100) == 1
-        assert inst.validate_range(193, 1, 100) == 100
-
-    def test_update_defaults(self, network_inst):
-        """Test update defaults function."""
+        assert network_inst.validate_range(value, 1, 100) == expected
+
+    @pytest.mark.parametrize(
+        "action, defaults, attributes",
+        [
+            (None, {"sleep": 5, "port": 1000}, {"sleep": 0.1, "port": 5025}),
+            ("clear_defaults", {}, {"sleep": 0.1, "port": 5025}),
+            ("set_defaults", {"sleep": 5, "port": 1000}, {"sleep": 5, "port": 1000}),
+        ],
+    )
+    def test_defaults(self, network_inst, action, defaults, attributes):
+        """Test update, clear and set defaults functions."""
         network_inst.update_defaults(sleep=5, port=1000)
-        assert network_inst.defaults == {"sleep": 5, "port": 1000}
+        if action is not None:
+            getattr(network_inst, action)()
+        assert network_inst.defaults == defaults
+        for key, value in attributes.items():
+            assert getattr(network_inst, key) == value
+
+    def test_update_invalid_defaults(self, network_inst):
+        """Test update defaults function with an unknown attribute."""
         with pytest.raises(RuntimeError):
             network_inst.update_defaults(noattr=1)
-
-    def test_clear_defaults(self, network_inst):
-        """Test clear defaults function."""
-        network_inst.update_defaults(sleep=5, port=1000)
-        network_inst.clear_defaults()
-        assert network_inst.defaults == {}
-
-    def test_set_defaults(self, network_inst):
-        """Test set defaults function."""
-        network_inst.update_defaults(sleep=5, port=1000)
-        network_inst.set_defaults()
-        assert network_inst.sleep == 5
-        assert network_inst.port == 1000
@@ -0,0 +1,125 @@
+"""Test PXIe-5170R driver."""
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import niscope as ni
+import pytest
+
+from qtics.instruments.niscope.pxie_5170r import Pxie570R, _num_channels
+
+N_CHANNELS = 2
+N_RECORDS = 3
+N_SAMPLES = 10
+
+
+class _StubView:
+    """Channels view fetching like NI-SCOPE, with each sample set to its record."""
+
+    def __init__(self, session):
+        """Initialize."""
+        self.session = session
+        self.fetch_num_records = -1
+        self.fetched_samples = []
+        self.error = None
+
+    def _actual_num_wfms(self):
+        """Return the number of waveforms of the records to fetch."""
+        if self.fetch_num_records == -1:
+            return N_CHANNELS * self.session.num_records
+        return N_CHANNELS * self.fetch_num_records
+
+    def fetch_into(self, waveform, relative_to=None, record_number=0, num_records=None):
+        """Fill the buffer, deriving the samples per waveform as NI-SCOPE does."""
+        if self.error is not None:
+            raise self.error
+        self.fetch_num_records = -1 if num_records is None else num_records
+        num_samples = int(len(waveform) / self._actual_num_wfms())
+        self.fetched_samples.append(num_samples)
+        acquired = min(num_samples, self.session.num_pts)
+        waveforms = []
+        for i in range(self._actual_num_wfms()):
+            samples = waveform[i * num_samples : i * num_samples + acquired]
+            samples[:] = record_number + i // N_CHANNELS
+            waveforms.append(SimpleNamespace(samples=samples))
+        return waveforms
+
+
+class _StubSession:
+    """NI-SCOPE session storing the horizontal configuration."""
+
+    def __init__(self):
+        """Initialize."""
+        self.num_pts = 0
+        self.num_records = 1
+        self.view = _StubView(self)
+        self.channels = {"0,1": self.view}
+
+    def configure_vertical(self, **_):
+        """Configure the vertical settings."""
+
+    def configure_horizontal_timing(self, min_num_pts, num_records, **_):
+        """Configure the record length and the number of records."""
+        self.num_pts = min_num_pts
+        self.num_records = num_records
+
+    def configure_trigger_digital(self, **_):
+        """Configure the trigger."""
+
+    def initiate(self):
+        """Start the acquisition."""
+        return nullcontext()
+
+    def close(self):
+        """Close the session."""
+
+
+@pytest.fixture
+def scope():
+    """Digitizer with a stub session."""
+    inst = Pxie570R("scope", "address")
+    inst.sample_rate = 1000
+    inst._session = _StubSession()
+    return inst
+
+
+def test_acquire(scope):
+    """Test a single record acquisition."""
+    waveforms = scope.acquire("0,1", N_SAMPLES / 1000)
+    assert [len(wfm.samples) for wfm in waveforms] == [N_SAMPLES] * N_CHANNELS
+
+
+def test_acquire_continuous(scope):
+    """Test every record is fetched with all its samples."""
+    records = scope.acquire_continuous("0,1", N_SAMPLES / 1000, N_RECORDS)
+    for record, waveforms in enumerate(records):
+        assert len(waveforms) == N_CHANNELS
+        for wfm in waveforms:
+            assert len(wfm.samples) == N_SAMPLES
+            assert (wfm.samples == record).all()
+    assert scope._session.view.fetched_samples == [N_SAMPLES] * N_RECORDS
+
+
+@pytest.mark.parametrize("error", [ni.Error("driver error"), TimeoutError()])
+def test_acquire_continuous_error(scope, error):
+    """Test fetch errors are raised to the consumer."""
+    scope._session.view.error = error
+    with pytest.raises(type(error)) as exc_info:
+        next(scope.acquire_continuous("0,1", N_SAMPLES / 1000, N_RECORDS))
+    assert exc_info.value is error
+
+
+@pytest.mark.parametrize(
+    "channels, expected",
+    [(0, 1), ("0", 1), ("0,1", 2), ("0-3", 4), ("0:1,3", 3), ([0, "1-2"], 3)],
+)
+def test_num_channels(channels, expected):
+    """Test counting the channels of a channel list."""
+    assert _num_channels(channels) == expected
+
+
+def test_not_connected():
+    """Test configuring without a session raises."""
+    inst = Pxie570R("scope", "address")
+    with pytest.raises(RuntimeError):
+        inst._configure(N_SAMPLES, 50)
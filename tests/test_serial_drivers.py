@@ -0,0 +1,113 @@
+"""Test serial instrument drivers."""
+
+import numpy as np
+import pytest
+
+from qtics.instruments.serial.keithley2231a import Keithley2231A
+from qtics.instruments.serial.keithley6514 import Keithley6514
+from qtics.instruments.serial.rf_attenuator_3494_64.rf_attenuator_3494_64 import (
+    Attenuator_3494_64,
+)
+from qtics.instruments.serial.rf_switch_R591722600.rf_switch_R591722600 import (
+    Switch_R591,
+)
+
+PINS_REPLY = b"".join(b"%d\tLOW\r\n" % pin for pin in range(2, 9))
+
+
+@pytest.mark.usefixtures("fake_serial")
+class TestSwitch:
+    """Test class for Switch_R591."""
+
+    @pytest.fixture
+    def switch(self):
+        """Connected switch on the fake port."""
+        inst = Switch_R591("switch", "address")
+        inst.connect()
+        return inst
+
+    @pytest.mark.parametrize(
+        "pin, written",
+        [
+            (2, b"SWI:ON 2\n"),
+            (np.int64(2), b"SWI:ON 2\n"),
+            ([1, 3], b"SWI:ON 1;SWI:ON 3\n"),
+            (np.arange(1, 4), b"SWI:ON 1;SWI:ON 2;SWI:ON 3\n"),
+        ],
+    )
+    def test_open(self, switch, pin, written):
+        """Test opening one or more ports."""
+        switch.open(pin)
+        assert switch.serial.written[-1] == written
+
+    def test_get_open_ports(self, switch):
+        """Test reading a reply with one line per open port."""
+        switch.serial.reply = b"1\r\n3\r\n"
+        switch.sleep = 0.01
+        assert switch.get_open_ports() == "1\n3"
+        switch.serial.reply = b""
+        assert switch.get_open_ports() == ""
+
+    def test_get_pins_state(self, switch):
+        """Test the following query is not mixed with the pins reply."""
+        switch.serial.reply = PINS_REPLY
+        assert switch.get_pins_state().splitlines() == [
+            f"{pin}\tLOW" for pin in range(2, 9)
+        ]
+        switch.serial.reply = b"5\r\n"
+        assert switch.pulse_lenght.strip() == "5"
+
+
+@pytest.mark.usefixtures("fake_serial")
+def test_attenuator_pins_state():
+    """Test reading the attenuator pins."""
+    inst = Attenuator_3494_64("attenuator", "address")
+    inst.connect()
+    inst.serial.reply = b"".join(b"%d\tHIGH\r\n" % pin for pin in range(3, 14))
+    assert len(inst.get_pins_state().splitlines()) == 11
+    assert inst.serial.rx == b""
+
+
+@pytest.mark.usefixtures("fake_serial")
+def test_attenuator_reset():
+    """Test the attenuation is written again after a reset."""
+    inst = Attenuator_3494_64("attenuator", "address")
+    inst.connect()
+    inst.update_defaults(attenuation=5)
+    inst.serial.written.clear()
+    inst.attenuation = 5
+    inst.attenuation = 5
+    inst.reset()
+    assert inst.serial.written[-1] == b"ATT 5\n"
+    assert inst.serial.written.count(b"ATT 5\n") == 2
+
+
+@pytest.mark.usefixtures("fake_serial")
+def test_keithley6514_read_data():
+    """Test the measurement is read with one compound command."""
+    inst = Keithley6514("electrometer", "address")
+    inst.connect()
+    inst.serial.reply = b"1.5E-09\n"
+    inst.serial.written.clear()
+    assert inst.read_data() == 1.5e-9
+    assert inst.serial.written == [b"FORM:ELEM READ;:ARM:COUN 1;:READ?\n"]
+
+
+@pytest.mark.usefixtures("fake_serial")
+def test_keithley2231a_snapshot():
+    """Test the state is read with one compound query and cached."""
+    inst = Keithley2231A("power_supply", "address")
+    inst.connect()
+    inst.serial.reply = b"2;1.5;0.1;30;3\n"
+    assert inst.snapshot() == {
+        "channel": 2,
+        "voltage": 1.5,
+        "current": 0.1,
+        "voltage_limit": 30,
+        "current_limit": 3,
+    }
+    assert inst.serial.written[-1] == (
+        b"INST:NSEL?;:SOUR:VOLT:LEV:IMM:AMPL?;:SOUR:CURR:LEV:IMM:AMPL?;"
+        b":SOUR:VOLT:LIMIT:LEV?;:SOUR:CURR:LIMIT:LEV?\n"
+    )
+    assert inst.voltage == 1.5
@@ -1,88 +1,166 @@
 """Test serial instrument base class."""
 
-from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE, Serial
-
-from qtics.instruments import Instrument, SerialInst
-
-
-def mock_pass(_=None, __=None):
-    """Mock function with no return."""
-    pass
-
-
-def mock_read(_, __):
-    """Mock read function."""
-    return b"test_read"
-
-
-def test_init():
-    """Test initialization."""
-    inst = SerialInst("name_inst", "address")
-    assert isinstance(inst, SerialInst)
-    assert isinstance(inst, Instrument)
-    assert inst.name == "name_inst"
-    assert inst.address == "address"
-    assert isinstance(inst.serial, Serial)
-    assert inst.serial.port == "address"
-    assert inst.serial.baudrate == 9600
-    assert inst.serial.bytesize == EIGHTBITS
-    assert inst.serial.parity == PARITY_NONE
-    assert inst.serial.stopbits == STOPBITS_ONE
-    assert inst.serial.timeout == 10
-    assert inst.sleep == 0.1
-
-
-def test_del(mocker):
-    """Test destructor."""
-    mocker.patch("serial.Serial.open", new_callable=lambda: mock_pass)
-    mocker.patch("serial.Serial.close", new_callable=lambda: mock_pass)
-    inst = SerialInst("name_inst", "address")
-    inst.connect()
-    del inst
-
-
-def test_connect(mocker):
-    """Test connect function."""
-    mocker.patch("serial.Serial.open", new_callable=lambda: mock_pass)
-    inst = SerialInst("name_inst", "address")
-    inst.connect()
+import time
+from unittest import mock
 
+import pytest
+from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE, Serial
 
-def test_disconnect(mocker):
-    """Test disconnect function."""
-    mocker.patch("serial.Serial.open", new_callable=lambda: mock_pass)
-    mocker.patch("serial.Serial.close", new_callable=lambda: mock_pass)
-    inst = SerialInst("name_inst", "address")
+from qtics.instruments import SerialInst
+
+
+@pytest.mark.usefixtures("fake_serial")
+class TestSerialInst:
+    """Test class for SerialInst."""
+
+    def test_init(self):
+        """Test initialization."""
+        inst = SerialInst("name_inst", "address")
+        assert isinstance(inst, SerialInst)
+        assert isinstance(inst.serial, Serial)
+        assert inst.serial.port == "address"
+        assert inst.serial.baudrate == 9600
+        assert inst.serial.bytesize == EIGHTBITS
+        assert inst.serial.parity == PARITY_NONE
+        assert inst.serial.stopbits == STOPBITS_ONE
+        assert inst.serial.timeout == 10
+        assert inst.sleep == 0.1
+
+    @pytest.mark.slow
+    def test_del(self):
+        """Test destructor."""
+        inst = SerialInst("name_inst", "address")
+        inst.connect()
+        del inst
+
+    def test_connect(self):
+        """Test connect function."""
+        inst = SerialInst("name_inst", "address")
+        inst.connect()
+
+    def test_disconnect(self):
+        """Test disconnect function."""
+        inst = SerialInst("name_inst", "address")
+        inst.connect()
+        inst.disconnect()
+
+    def test_write(self):
+        """Test write function."""
+        inst = SerialInst("name_inst", "address")
+        inst.write("test_cmd")
+
+    @pytest.fixture
+    def serial_inst(self):
+        """Connected instrument on the fake port."""
+        inst = SerialInst("name_inst", "address")
+        inst.connect()
+        return inst
+
+    def test_read(self, serial_inst):
+        """Test read function."""
+        assert SerialInst("name_inst", "address").read() == ""
+        assert serial_inst.read() == "test_read"
+        assert serial_inst.read_bytes() == b"test_read"
+
+    def test_read_until_terminator(self, serial_inst):
+        """Test read function with a response split in multiple chunks."""
+        chunks = [b"test", b"", b"_re", b"ad\nnext\n"]
+        serial_inst.serial.read = lambda _: chunks.pop(0)
+        assert serial_inst.read() == "test_read"
+        assert chunks == []
+        assert serial_inst.read() == "next"
+
+    def test_query(self, serial_inst):
+        """Test query function."""
+        assert SerialInst("name_inst", "address").query("cmd") == ""
+        with mock.patch.object(time, "sleep") as sleep:
+            assert serial_inst.query("cmd") == "test_read"
+            sleep.assert_not_called()
+            assert serial_inst.query("cmd", pre_read_sleep=0.5) == "test_read"
+            sleep.assert_called_once_with(0.5)
+
+    def test_query_lines(self, serial_inst):
+        """Test reading a response made of multiple lines."""
+        serial_inst.serial.reply = b"1\r\n3\r\n"
+        assert serial_inst.query_lines("cmd?", 2) == ["1", "3"]
+        assert serial_inst.query_lines("cmd?", quiet=0.01) == ["1", "3"]
+        assert serial_inst.query("cmd?") == "1\r"
+        assert serial_inst.read() == "3\r"
+        serial_inst.serial.reply = b""
+        assert serial_inst.query_lines("cmd?", quiet=0.01) == []
+
+    def test_query_many(self, serial_inst):
+        """Test query_many function."""
+        serial_inst.serial.reply = b"a;b\n"
+        assert serial_inst.query_many(["cmd1?", ":cmd2?"]) == ["a", "b"]
+        assert serial_inst.serial.written[-1] == b"cmd1?;:cmd2?\n"
+
+    def test_query_many_fallback(self, serial_inst):
+        """Test queries are sent one by one if the compound one is not supported."""
+        assert serial_inst.query_many(["cmd1?", "cmd2?"]) == [
+            "test_read",
+            "test_read",
+        ]
+        assert serial_inst.serial.written[-2:] == [b"cmd1?\n", b"cmd2?\n"]
+
+    def test_query_many_lines(self, serial_inst):
+        """Test the fallback is not shifted by a compound response on many lines."""
+        serial_inst.sleep = 0.01
+        serial_inst.serial.replies = {
+            b"cmd1?;cmd2?\n": b"a\nb\n",
+            b"cmd1?\n": b"a\n",
+            b"cmd2?\n": b"b\n",
+        }
+        assert serial_inst.query_many(["cmd1?", "cmd2?"]) == ["a", "b"]
+        assert serial_inst.serial.rx == b""
+        assert serial_inst.query("cmd3?") == "test_read"
+
+    def test_query_float(self, serial_inst):
+        """Test query_float function."""
+        serial_inst.serial.reply = b"1.5\n"
+        assert serial_inst.query_float("cmd?") == 1.5
+        serial_inst.serial.reply = b"error\n"
+        with pytest.raises(ValueError, match="name_inst"):
+            serial_inst.query_float("cmd?")
+        serial_inst.disconnect()
+        with pytest.raises(ConnectionError, match="not connected"):
+            serial_inst.query_float("cmd?")
+
+    def test_batch(self, serial_inst):
+        """Test batched writes."""
+        written = serial_inst.serial.written
+        with serial_inst.batch():
+            serial_inst.write("cmd1")
+            serial_inst.write("cmd2")
+            assert written == []
+            assert serial_inst.query("cmd3?") == "test_read"
+            serial_inst.write("cmd4")
+        assert written == [b"cmd1;cmd2;cmd3?\n", b"cmd4\n"]
+
+
+@pytest.mark.slow
+def test_process_reader():
+    """Test the serial port handled by a reader process."""
+    inst = SerialInst("name_inst", "loop://", timeout=2, use_process_reader=True)
     inst.connect()
-    inst.serial.is_open = True  # patch connection
-    inst.disconnect()
-
-
-def test_write(mocker):
-    """Test write function."""
-    mocker.patch("serial.Serial.write", new_callable=lambda: mock_pass)
-    inst = SerialInst("name_inst", "address")
-    inst.write("test_cmd")
+    try:
+        assert inst.query("test_read") == "test_read"
+        inst.write("line1")
+        inst.write("line2")
+        assert inst.read() == "line1"
+        assert inst.read() == "line2"
+        inst.write("line3")
+        inst.write("line4")
+        assert inst.read_lines(quiet=0.2) == ["line3", "line4"]
+    finally:
+        inst.disconnect()
+    assert inst.read() == ""
 
 
-def test_read(mocker):
-    """Test read function."""
-    mocker.patch("serial.Serial.read", new_callable=lambda: mock_read)
-    mocker.patch("serial.Serial.in_waiting", new_callable=lambda: 5)
-    inst = SerialInst("name_inst", "address")
-    assert inst.read() == ""
-    inst.serial.is_open = True
-    inst.serial.fd = None
-    assert inst.read() == "test_read"
-
-
-def test_query(mocker):
-    """Test query function."""
-    mocker.patch("serial.Serial.write", new_callable=lambda: mock_pass)
-    mocker.patch("serial.Serial.read", new_callable=lambda: mock_read)
-    mocker.patch("serial.Serial.in_waiting", new_callable=lambda: 5)
-    inst = SerialInst("name_inst", "address")
-    assert inst.query("cmd") == ""
-    inst.serial.is_open = True
-    inst.serial.fd = None
-    assert inst.read() == "test_read"
+@pytest.mark.slow
+def test_process_reader_invalid_port():
+    """Test the error opening the port is raised in the main process."""
+    inst = SerialInst("name_inst", "invalid://", timeout=2, use_process_reader=True)
+    with pytest.raises(ValueError):
+        inst.connect()
+    assert not inst._is_open